@@ -10,10 +10,12 @@ from django.contrib import admin
 from django.utils.html import format_html
 from django.utils import timezone
 from django.urls import reverse
-from django.http import HttpResponseRedirect, HttpResponse
+from django.http import HttpResponseRedirect, StreamingHttpResponse
 from django.contrib import messages
-from django.db.models import Count, Avg
+from django.core.cache import cache
+from django.db.models import Count, Avg, Q
 import csv
+import itertools
 
 from .models import (
     SiteSettings, Skill, Experience, Education, Certification,
@@ -21,6 +23,11 @@ from .models import (
     ContactMessage, Newsletter, Achievement, Service, FAQ,
     SocialProof, AnalyticsSnapshot,
 )
+from .signals import DERIVED_CACHE_KEYS
+from .search import (
+    BLOGPOST_SEARCH_FIELDS, CONTACT_SEARCH_FIELDS, PROJECT_SEARCH_FIELDS,
+    contains_any, full_text_search, uses_full_text_search,
+)
 
 # ─────────────────────────────────────────────────────────────────
 # Admin site meta
@@ -105,6 +112,48 @@ PRIORITY_COLORS = {
     "urgent": "#dc2626",
 }
 
+# ─────────────────────────────────────────────────────────────────
+# Pre-rendered cells
+#
+# Proficiency (0–100), rating (1–5), priority and certificate validity
+# have small fixed domains, so their changelist HTML is rendered once
+# at import and looked up per row. Out-of-range values render live.
+# ─────────────────────────────────────────────────────────────────
+
+def _render_proficiency_bar(p):
+    c = "#10b981" if p >= 75 else "#f59e0b" if p >= 50 else "#ef4444"
+    return format_html(
+        '<div style="display:flex;align-items:center;gap:6px;">'
+        '<div style="width:100px;background:#e5e7eb;border-radius:99px;height:10px;'
+        'overflow:hidden;">'
+        '<div style="width:{p}%;background:{c};height:10px;border-radius:99px;'
+        'transition:width .3s;"></div></div>'
+        '<span style="font-size:11px;font-weight:700;color:#374151;">{p}%</span>'
+        '</div>',
+        p=p, c=c,
+    )
+
+
+def _render_stars(rating):
+    filled = "★" * rating
+    empty  = "☆" * (5 - rating)
+    color  = "#f59e0b" if rating >= 4 else "#9ca3af"
+    return format_html(
+        '<span style="color:{c};font-size:15px;">{f}</span>'
+        '<span style="color:#d1d5db;font-size:15px;">{e}</span>',
+        c=color, f=filled, e=empty,
+    )
+
+
+PROFICIENCY_BARS = {p: _render_proficiency_bar(p) for p in range(101)}
+STAR_RATINGS     = {r: _render_stars(r) for r in range(6)}
+PRIORITY_BADGES  = {
+    key: _badge(label, PRIORITY_COLORS[key])
+    for key, label in ContactMessage.PRIORITY_CHOICES
+}
+EXPIRED_BADGE = format_html('<span style="color:#ef4444;font-weight:700;">⚠ Expired</span>')
+VALID_BADGE   = format_html('<span style="color:#059669;font-weight:700;">✓ Valid</span>')
+
 # ─────────────────────────────────────────────────────────────────
 # Reusable Mixins
 # ─────────────────────────────────────────────────────────────────
@@ -137,24 +186,108 @@ class ImagePreviewMixin:
     thumbnail_tag.short_description = "Thumb"
 
 
-class ExportCsvMixin:
-    """Adds a CSV-export bulk action."""
+class ChangelistDeferMixin:
+    """
+    Skips loading the `list_defer` columns on changelist pages, where
+    they are never displayed. Change forms still load every field.
+    """
+
+    list_defer = ()
+
+    def get_queryset(self, request):
+        qs    = super().get_queryset(request)
+        match = request.resolver_match
+        if self.list_defer and match and match.url_name.endswith("_changelist"):
+            qs = qs.defer(*self.list_defer)
+        return qs
+
+
+class _EchoBuffer:
+    """File-like object whose write() hands the row back to the caller."""
+
+    def write(self, value):
+        return value
+
+
+class BulkActionMixin:
+    """
+    Shared helpers for bulk actions. Actions expressible as one UPDATE
+    should stay as `qs.update(...)`; row-by-row actions walk the
+    selection with `iter_selected()` so memory stays bounded.
+    """
+
+    bulk_chunk_size = 1000
+
+    def iter_selected(self, queryset):
+        return queryset.iterator(chunk_size=self.bulk_chunk_size)
+
+
+class DerivedCacheMixin:
+    """
+    Drops the model's derived view caches after a bulk action. Actions
+    written as `qs.update(...)` send no post_save, so the receiver in
+    core/signals.py never sees them.
+    """
+
+    def response_action(self, request, queryset):
+        response = super().response_action(request, queryset)
+        cache.delete_many(DERIVED_CACHE_KEYS.get(self.model, ()))
+        return response
+
+
+class ExportCsvMixin(BulkActionMixin):
+    """Adds a CSV-export bulk action, streamed so memory stays flat."""
 
     @admin.action(description="⬇ Export selected as CSV")
     def export_as_csv(self, request, queryset):
         meta   = self.model._meta
         fields = [f.name for f in meta.fields]
-        resp   = HttpResponse(content_type="text/csv")
+        w      = csv.writer(_EchoBuffer())
+        rows   = (
+            w.writerow([getattr(obj, f) for f in fields])
+            for obj in self.iter_selected(queryset.defer(None))
+        )
+        resp = StreamingHttpResponse(
+            itertools.chain([w.writerow(fields)], rows),
+            content_type="text/csv",
+        )
         resp["Content-Disposition"] = (
             f'attachment; filename="{meta.verbose_name_plural}.csv"'
         )
-        w = csv.writer(resp)
-        w.writerow(fields)
-        for obj in queryset:
-            w.writerow([getattr(obj, f) for f in fields])
         return resp
 
 
+class FullTextSearchMixin:
+    """
+    On PostgreSQL, answers changelist searches from the GIN index over
+    `search_vector_fields` instead of an ILIKE scan per search field. The
+    last word matches as a prefix, so "Jan" still finds "Jane".
+    `search_substring_fields` are also matched with ILIKE: the parser
+    keeps an address as one lexeme, so "gmail" would never find
+    "x@gmail.com" through the index. Autocomplete widgets keep substring
+    matching for type-ahead.
+    """
+
+    search_vector_fields = ()
+    search_substring_fields = ()
+
+    def get_search_results(self, request, queryset, search_term):
+        match = request.resolver_match
+        if match and match.url_name == "autocomplete":
+            return super().get_search_results(request, queryset, search_term)
+        if search_term and self.search_vector_fields and uses_full_text_search(queryset):
+            results = full_text_search(
+                queryset, self.search_vector_fields, search_term, prefix=True,
+            )
+            if self.search_substring_fields:
+                results = queryset.filter(
+                    Q(pk__in=results.values("pk"))
+                    | contains_any(self.search_substring_fields, search_term)
+                )
+            return results, False
+        return super().get_search_results(request, queryset, search_term)
+
+
 # ─────────────────────────────────────────────────────────────────
 # SiteSettings  (Singleton)
 # ─────────────────────────────────────────────────────────────────
@@ -245,7 +378,7 @@ class SiteSettingsAdmin(ImagePreviewMixin, admin.ModelAdmin):
 # ─────────────────────────────────────────────────────────────────
 
 @admin.register(Skill)
-class SkillAdmin(ExportCsvMixin, admin.ModelAdmin):
+class SkillAdmin(DerivedCacheMixin, ExportCsvMixin, admin.ModelAdmin):
 
     list_display   = ("name", "_cat_badge", "_proficiency_bar",
                       "years_experience", "featured", "is_active", "order")
@@ -279,17 +412,7 @@ class SkillAdmin(ExportCsvMixin, admin.ModelAdmin):
 
     def _proficiency_bar(self, obj):
         p = obj.proficiency
-        c = "#10b981" if p >= 75 else "#f59e0b" if p >= 50 else "#ef4444"
-        return format_html(
-            '<div style="display:flex;align-items:center;gap:6px;">'
-            '<div style="width:100px;background:#e5e7eb;border-radius:99px;height:10px;'
-            'overflow:hidden;">'
-            '<div style="width:{p}%;background:{c};height:10px;border-radius:99px;'
-            'transition:width .3s;"></div></div>'
-            '<span style="font-size:11px;font-weight:700;color:#374151;">{p}%</span>'
-            '</div>',
-            p=p, c=c,
-        )
+        return PROFICIENCY_BARS.get(p) or _render_proficiency_bar(p)
     _proficiency_bar.short_description = "Proficiency"
 
     @admin.action(description="✅ Activate selected")
@@ -313,7 +436,7 @@ class SkillAdmin(ExportCsvMixin, admin.ModelAdmin):
 # ─────────────────────────────────────────────────────────────────
 
 @admin.register(Experience)
-class ExperienceAdmin(ExportCsvMixin, admin.ModelAdmin):
+class ExperienceAdmin(DerivedCacheMixin, ExportCsvMixin, admin.ModelAdmin):
 
     list_display   = ("title", "company", "_emp_badge", "start_date",
                       "_end", "_dur", "is_current", "order")
@@ -366,7 +489,7 @@ class ExperienceAdmin(ExportCsvMixin, admin.ModelAdmin):
 # ─────────────────────────────────────────────────────────────────
 
 @admin.register(Education)
-class EducationAdmin(ExportCsvMixin, admin.ModelAdmin):
+class EducationAdmin(DerivedCacheMixin, ExportCsvMixin, admin.ModelAdmin):
     list_display   = ("degree", "field_of_study", "institution",
                       "start_date", "end_date", "_grade_badge", "is_current", "order")
     list_filter    = ("is_current",)
@@ -385,12 +508,29 @@ class EducationAdmin(ExportCsvMixin, admin.ModelAdmin):
 # Certification
 # ─────────────────────────────────────────────────────────────────
 
+class CertificationStatusFilter(admin.SimpleListFilter):
+    """Valid / expired, resolved in SQL against today's date."""
+    title          = "status"
+    parameter_name = "expiry"
+
+    def lookups(self, request, model_admin):
+        return (("valid", "Valid"), ("expired", "Expired"))
+
+    def queryset(self, request, queryset):
+        today = timezone.localdate()
+        if self.value() == "expired":
+            return queryset.filter(expiry_date__lt=today)
+        if self.value() == "valid":
+            return queryset.filter(Q(expiry_date__isnull=True) | Q(expiry_date__gte=today))
+        return queryset
+
+
 @admin.register(Certification)
 class CertificationAdmin(ImagePreviewMixin, ExportCsvMixin, admin.ModelAdmin):
 
     list_display      = ("name", "issuing_organization", "issue_date",
                          "_expiry", "_valid_badge", "_cert_thumb", "order")
-    list_filter       = ("issuing_organization",)
+    list_filter       = (CertificationStatusFilter, "issuing_organization")
     search_fields     = ("name", "issuing_organization", "credential_id")
     filter_horizontal = ("skills",)
     readonly_fields   = ("_cert_thumb",)
@@ -407,13 +547,7 @@ class CertificationAdmin(ImagePreviewMixin, ExportCsvMixin, admin.ModelAdmin):
     _expiry.short_description = "Expires"
 
     def _valid_badge(self, obj):
-        if obj.is_expired:
-            return format_html(
-                '<span style="color:#ef4444;font-weight:700;">⚠ Expired</span>'
-            )
-        return format_html(
-            '<span style="color:#059669;font-weight:700;">✓ Valid</span>'
-        )
+        return EXPIRED_BADGE if obj.is_expired else VALID_BADGE
     _valid_badge.short_description = "Status"
 
 
@@ -440,19 +574,22 @@ class ProjectGalleryInline(admin.TabularInline):
 
 
 @admin.register(Project)
-class ProjectAdmin(ImagePreviewMixin, ExportCsvMixin, admin.ModelAdmin):
+class ProjectAdmin(DerivedCacheMixin, FullTextSearchMixin, ChangelistDeferMixin,
+                   ImagePreviewMixin, ExportCsvMixin, admin.ModelAdmin):
 
     list_display   = ("thumbnail_tag", "title", "_cat_badge", "_status_badge",
                       "_tech_pills", "_views_pill", "featured", "order", "created_at")
     list_filter    = ("status", "category", "featured")
     search_fields  = ("title", "description", "technologies", "client")
+    search_vector_fields = PROJECT_SEARCH_FIELDS
+    list_defer     = ("description", "full_description", "meta_description")
     list_editable  = ("featured", "order")
     prepopulated_fields = {"slug": ("title",)}
     readonly_fields = ("views", "likes", "created_at", "updated_at", "thumbnail_tag")
     date_hierarchy  = "project_date"
     inlines         = [ProjectGalleryInline]
     actions         = ["export_as_csv", "mark_featured", "mark_completed",
-                       "mark_in_progress", "reset_views"]
+                       "mark_in_progress", "reset_views", "regenerate_thumbnails"]
 
     fieldsets = (
         ("📋 Basic Information", {
@@ -545,6 +682,28 @@ class ProjectAdmin(ImagePreviewMixin, ExportCsvMixin, admin.ModelAdmin):
         n = qs.update(views=0)
         self.message_user(request, f"Views reset for {n} project(s).", messages.WARNING)
 
+    @admin.action(description="🖼️ Regenerate thumbnails")
+    def regenerate_thumbnails(self, request, qs):
+        projects, stale, skipped = [], [], 0
+        for project in qs.exclude(featured_image="").only("id", "featured_image", "thumbnail"):
+            try:
+                thumb = project.make_thumbnail()
+            except Exception:
+                # Unreadable or missing image: keep this row's thumbnail
+                skipped += 1
+                continue
+            if project.thumbnail:
+                stale.append((project.thumbnail.storage, project.thumbnail.name))
+            project.thumbnail.save(thumb.name, thumb, save=False)
+            projects.append(project)
+        Project.objects.bulk_update(projects, ["thumbnail"], batch_size=500)
+        # Old files go only once no row points at them any more
+        for storage, name in stale:
+            storage.delete(name)
+        self.message_user(request, f"Thumbnails regenerated for {len(projects)} project(s).", messages.SUCCESS)
+        if skipped:
+            self.message_user(request, f"{skipped} project(s) skipped: image could not be read.", messages.WARNING)
+
 
 # ─────────────────────────────────────────────────────────────────
 # ProjectGallery  (standalone bulk management)
@@ -556,6 +715,8 @@ class ProjectGalleryAdmin(admin.ModelAdmin):
     list_filter   = ("project",)
     search_fields = ("project__title", "caption")
     list_editable = ("order",)
+    list_select_related = ("project",)
+    autocomplete_fields = ("project",)
 
     def _thumb(self, obj):
         if obj.image:
@@ -583,14 +744,20 @@ class BlogCommentInline(admin.TabularInline):
 
 
 @admin.register(BlogPost)
-class BlogPostAdmin(ImagePreviewMixin, ExportCsvMixin, admin.ModelAdmin):
+class BlogPostAdmin(DerivedCacheMixin, FullTextSearchMixin, ChangelistDeferMixin,
+                    ImagePreviewMixin, ExportCsvMixin, admin.ModelAdmin):
 
     list_display   = ("thumbnail_tag", "title", "author", "_status_badge",
                       "published_date", "_read_time", "_views_pill",
                       "_comments_count", "featured")
     list_filter    = ("status", "featured", "author")
     search_fields  = ("title", "excerpt", "content")
+    search_vector_fields = BLOGPOST_SEARCH_FIELDS
+    list_defer     = ("content", "excerpt", "meta_description")
     list_editable  = ("featured",)
+    list_select_related = ("author",)
+    autocomplete_fields = ("author",)
+    show_full_result_count = False
     prepopulated_fields = {"slug": ("title",)}
     readonly_fields = ("views", "likes", "reading_time", "created_at",
                        "updated_at", "published_date", "thumbnail_tag")
@@ -648,9 +815,15 @@ class BlogPostAdmin(ImagePreviewMixin, ExportCsvMixin, admin.ModelAdmin):
     _views_pill.short_description = "Views"
     _views_pill.admin_order_field = "views"
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).annotate(
+            _comment_total=Count("comments"),
+            _comment_pending=Count("comments", filter=Q(comments__is_approved=False)),
+        )
+
     def _comments_count(self, obj):
-        total   = obj.comments.count()
-        pending = obj.comments.filter(is_approved=False).count()
+        total   = obj._comment_total
+        pending = obj._comment_pending
         if pending:
             return format_html(
                 '💬 {} <span style="color:#ef4444;font-size:10px;font-weight:700;">'
@@ -659,6 +832,7 @@ class BlogPostAdmin(ImagePreviewMixin, ExportCsvMixin, admin.ModelAdmin):
             )
         return format_html("💬 {}", total)
     _comments_count.short_description = "Comments"
+    _comments_count.admin_order_field = "_comment_total"
 
     @admin.action(description="🚀 Publish selected posts")
     def publish_posts(self, request, qs):
@@ -683,12 +857,16 @@ class BlogPostAdmin(ImagePreviewMixin, ExportCsvMixin, admin.ModelAdmin):
 # ─────────────────────────────────────────────────────────────────
 
 @admin.register(BlogComment)
-class BlogCommentAdmin(admin.ModelAdmin):
+class BlogCommentAdmin(ChangelistDeferMixin, admin.ModelAdmin):
 
     list_display   = ("name", "email", "_post_link", "_approval_badge",
                       "_type", "created_at")
     list_filter    = ("is_approved", "created_at")
     search_fields  = ("name", "email", "content", "post__title")
+    list_defer     = ("content", "post__content", "post__excerpt")
+    list_select_related = ("post",)
+    autocomplete_fields = ("post", "parent")
+    show_full_result_count = False
     readonly_fields = ("ip_address", "created_at", "updated_at")
     actions = ["approve_comments", "unapprove_comments"]
 
@@ -711,7 +889,7 @@ class BlogCommentAdmin(admin.ModelAdmin):
     def _type(self, obj):
         return format_html(
             '<span style="color:#8b5cf6;">↩ Reply</span>'
-        ) if obj.parent else format_html(
+        ) if obj.parent_id else format_html(
             '<span style="color:#6b7280;">● Root</span>'
         )
     _type.short_description = "Type"
@@ -732,13 +910,15 @@ class BlogCommentAdmin(admin.ModelAdmin):
 # ─────────────────────────────────────────────────────────────────
 
 @admin.register(Testimonial)
-class TestimonialAdmin(ImagePreviewMixin, ExportCsvMixin, admin.ModelAdmin):
+class TestimonialAdmin(DerivedCacheMixin, ImagePreviewMixin, ExportCsvMixin, admin.ModelAdmin):
 
     list_display   = ("_photo", "name", "position", "company",
                       "_stars", "_project_link", "is_featured", "is_approved", "order")
     list_filter    = ("is_featured", "is_approved", "rating")
     search_fields  = ("name", "company", "content")
     list_editable  = ("is_featured", "is_approved", "order")
+    list_select_related = ("project",)
+    autocomplete_fields = ("project",)
     readonly_fields = ("_photo",)
     actions = ["export_as_csv", "approve_all", "feature_all"]
 
@@ -748,14 +928,7 @@ class TestimonialAdmin(ImagePreviewMixin, ExportCsvMixin, admin.ModelAdmin):
     _photo.short_description = "Photo"
 
     def _stars(self, obj):
-        filled = "★" * obj.rating
-        empty  = "☆" * (5 - obj.rating)
-        color  = "#f59e0b" if obj.rating >= 4 else "#9ca3af"
-        return format_html(
-            '<span style="color:{c};font-size:15px;">{f}</span>'
-            '<span style="color:#d1d5db;font-size:15px;">{e}</span>',
-            c=color, f=filled, e=empty,
-        )
+        return STAR_RATINGS.get(obj.rating) or _render_stars(obj.rating)
     _stars.short_description = "Rating"
     _stars.admin_order_field = "rating"
 
@@ -782,12 +955,17 @@ class TestimonialAdmin(ImagePreviewMixin, ExportCsvMixin, admin.ModelAdmin):
 # ─────────────────────────────────────────────────────────────────
 
 @admin.register(ContactMessage)
-class ContactMessageAdmin(ExportCsvMixin, admin.ModelAdmin):
+class ContactMessageAdmin(FullTextSearchMixin, ChangelistDeferMixin, ExportCsvMixin,
+                          admin.ModelAdmin):
 
     list_display   = ("name", "email", "_subj", "_priority_badge",
                       "_read_status", "_responded_status", "created_at")
     list_filter    = ("is_read", "is_responded", "priority", "created_at")
     search_fields  = ("name", "email", "subject", "message")
+    search_vector_fields = CONTACT_SEARCH_FIELDS
+    search_substring_fields = ("email",)
+    list_defer     = ("message", "user_agent")
+    show_full_result_count = False
     readonly_fields = ("ip_address", "user_agent", "referrer",
                        "created_at", "updated_at")
     date_hierarchy = "created_at"
@@ -811,8 +989,9 @@ class ContactMessageAdmin(ExportCsvMixin, admin.ModelAdmin):
     _subj.short_description = "Subject"
 
     def _priority_badge(self, obj):
-        return _badge(obj.get_priority_display(),
-                      PRIORITY_COLORS.get(obj.priority, "#6b7280"))
+        return PRIORITY_BADGES.get(obj.priority) or _badge(
+            obj.get_priority_display(), PRIORITY_COLORS.get(obj.priority, "#6b7280")
+        )
     _priority_badge.short_description = "Priority"
     _priority_badge.admin_order_field = "priority"
 
@@ -865,6 +1044,7 @@ class NewsletterAdmin(ExportCsvMixin, admin.ModelAdmin):
                       "source", "subscribed_at")
     list_filter    = ("is_active", "is_verified", "source")
     search_fields  = ("email", "name")
+    show_full_result_count = False
     readonly_fields = ("subscribed_at", "verification_token", "ip_address")
     date_hierarchy = "subscribed_at"
     actions = ["export_as_csv", "activate_subs", "deactivate_subs"]
@@ -905,7 +1085,7 @@ ACH_COLORS = {
 
 
 @admin.register(Achievement)
-class AchievementAdmin(ImagePreviewMixin, ExportCsvMixin, admin.ModelAdmin):
+class AchievementAdmin(DerivedCacheMixin, ImagePreviewMixin, ExportCsvMixin, admin.ModelAdmin):
 
     list_display   = ("title", "_cat_badge", "issuer", "date_achieved",
                       "_img_preview", "order")
@@ -930,7 +1110,7 @@ class AchievementAdmin(ImagePreviewMixin, ExportCsvMixin, admin.ModelAdmin):
 # ─────────────────────────────────────────────────────────────────
 
 @admin.register(Service)
-class ServiceAdmin(ImagePreviewMixin, ExportCsvMixin, admin.ModelAdmin):
+class ServiceAdmin(DerivedCacheMixin, ImagePreviewMixin, ExportCsvMixin, admin.ModelAdmin):
 
     list_display   = ("_svc_thumb", "title", "_price_badge",
                       "is_active", "featured", "order")
@@ -989,7 +1169,7 @@ class ServiceAdmin(ImagePreviewMixin, ExportCsvMixin, admin.ModelAdmin):
 # ─────────────────────────────────────────────────────────────────
 
 @admin.register(FAQ)
-class FAQAdmin(ExportCsvMixin, admin.ModelAdmin):
+class FAQAdmin(DerivedCacheMixin, ExportCsvMixin, admin.ModelAdmin):
 
     list_display   = ("_q", "_cat_badge", "order", "is_active")
     list_filter    = ("is_active", "category")
@@ -1023,7 +1203,7 @@ SP_COLORS = {
 
 
 @admin.register(SocialProof)
-class SocialProofAdmin(ExportCsvMixin, admin.ModelAdmin):
+class SocialProofAdmin(DerivedCacheMixin, ExportCsvMixin, admin.ModelAdmin):
 
     list_display   = ("label", "_mtype_badge", "_value_display", "order", "is_active")
     list_filter    = ("metric_type", "is_active")
@@ -1068,6 +1248,7 @@ class AnalyticsSnapshotAdmin(admin.ModelAdmin):
                        "contact_submissions", "newsletter_signups")
 
     date_hierarchy = "date"
+    show_full_result_count = False
 
     def _stat(self, val, color="#3b82f6"):
         return format_html(
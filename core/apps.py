@@ -7,4 +7,5 @@ class CoreConfig(AppConfig):
     verbose_name = 'Portfolio Core'
     
     def ready(self):
+        import core.checks
         import core.signals
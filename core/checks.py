@@ -0,0 +1,15 @@
+from django.conf import settings
+from django.core.checks import Error, register
+
+
+@register()
+def check_site_url(app_configs, **kwargs):
+    """Production needs SITE_URL: every link in the site's e-mails uses it."""
+    if settings.DEBUG or settings.SITE_URL:
+        return []
+    return [Error(
+        'SITE_URL is not set.',
+        hint='Set it to the public address, e.g. https://example.com; '
+             'newsletter verification and other e-mailed links are built from it.',
+        id='core.E001',
+    )]
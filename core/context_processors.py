@@ -1,3 +1,5 @@
+from django.utils.functional import SimpleLazyObject
+
 from .models import Service
 from .views import get_site_settings
 
@@ -7,14 +9,17 @@ def global_context(request):
     Global template context available on all pages.
 
     Provides:
-    - site_settings: singleton SiteSettings instance (cached via get_site_settings)
+    - site_settings: singleton SiteSettings instance (cached via get_site_settings),
+      loaded only if a template reads it and the view didn't supply its own
     - footer_services: up to 6 active services for footer navigation
     """
     return {
-        "footer_services": Service.objects.filter(is_active=True).order_by(
-            "-featured", "order"
-        )[:6],
-        "site_settings": get_site_settings(),
+        "footer_services": (
+            Service.objects.filter(is_active=True)
+            .only("title", "slug")
+            .order_by("-featured", "order")[:6]
+        ),
+        "site_settings": SimpleLazyObject(get_site_settings),
     }
 
 from .models import SiteSettings
@@ -0,0 +1,45 @@
+"""
+Resizing for uploaded images.
+
+SiteSettings.profile_image and Project thumbnails both go through
+resize_encode(), so the decode/resize/encode pipeline lives in one place.
+"""
+from io import BytesIO
+
+from django.core.files.uploadedfile import InMemoryUploadedFile
+
+# Progressive, 4:2:0 chroma subsampling, optimized Huffman tables.
+JPEG_KWARGS = {
+    'format': 'JPEG',
+    'optimize': True,
+    'progressive': True,
+    'subsampling': '4:2:0',
+}
+
+
+def resize_encode(djfile, size, name, quality=85):
+    """
+    Shrink `djfile` to fit within `size` and re-encode it as a JPEG.
+
+    Returns an InMemoryUploadedFile called `name`, ready to assign to an
+    ImageField.
+    """
+    # Imported here so loading the models doesn't pull Pillow into every
+    # process; only the admin upload path needs it.
+    from PIL import Image
+
+    with Image.open(djfile) as img:
+        # draft() lets libjpeg decode JPEGs at a reduced scale instead of
+        # full resolution (no-op for other formats)
+        img.draft('RGB', size)
+        if img.mode in ('RGBA', 'LA', 'P'):
+            img = img.convert('RGB')
+        img.thumbnail(size, Image.Resampling.LANCZOS, reducing_gap=2.0)
+
+        output = BytesIO()
+        img.save(output, quality=quality, **JPEG_KWARGS)
+
+    output.seek(0)
+    return InMemoryUploadedFile(
+        output, 'ImageField', name, 'image/jpeg', output.getbuffer().nbytes, None
+    )
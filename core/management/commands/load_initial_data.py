@@ -1,17 +1,97 @@
+from datetime import date
+
 from django.core.management.base import BaseCommand
+from django.db import transaction
 from django.utils import timezone
+from django.utils.text import slugify
 from django.contrib.auth.models import User
 from core.models import SiteSettings, Skill, Experience, Education, Certification, Project, Service
 from taggit.models import Tag
 
+# (name, category, proficiency, icon_class)
+SKILLS = (
+    ("Python", "backend", 95, "fab fa-python"),
+    ("Django", "backend", 90, "fab fa-python"),
+    ("React", "frontend", 80, "fab fa-react"),
+    ("HTML5", "frontend", 95, "fab fa-html5"),
+    ("CSS3", "frontend", 90, "fab fa-css3-alt"),
+    ("JavaScript", "frontend", 85, "fab fa-js"),
+    ("Docker", "devops", 70, "fab fa-docker"),
+    ("PostgreSQL", "database", 80, "fas fa-database"),
+    ("Git & GitHub", "tools", 95, "fab fa-git-alt"),
+    ("Machine Learning", "other", 85, "fas fa-brain"),
+)
+
+# (title, category, technologies, description)
+PROJECTS = (
+    (
+        "Online Pharmacy System",
+        "fullstack",
+        "Django, PostgreSQL, Bootstrap, JavaScript",
+        "Built an online pharmacy platform with secure authentication and prescriptions.",
+    ),
+    (
+        "Portfolio Website",
+        "fullstack",
+        "Django, HTML, CSS, Bootstrap, JavaScript",
+        "Personal portfolio showcasing projects, blogs, and achievements.",
+    ),
+    (
+        "Network Performance Dashboard",
+        "backend",
+        "Python, Django, REST API, Chart.js",
+        "Dashboard for visualizing network metrics and uptime reports.",
+    ),
+)
+
+# (title, short_description, icon, starting_price)
+SERVICES = (
+    ("Web Development", "Building secure, scalable web applications.", "fas fa-laptop-code", 300.00),
+    ("Machine Learning Solutions", "AI-driven analytics and prediction tools.", "fas fa-brain", 500.00),
+    ("API Development", "RESTful APIs for mobile and web platforms.", "fas fa-cogs", 250.00),
+    ("IT Consultation", "Expert advice for tech integration.", "fas fa-headset", 150.00),
+)
+
+TAGS = ("django", "ml", "ai", "react", "python", "fullstack")
+
+
+def create_missing(model, objs, *key_fields):
+    """
+    bulk_create the objs whose natural key isn't in the table yet.
+
+    For models without a unique column for ignore_conflicts to catch: one
+    query fetches the existing keys, one multi-row INSERT adds the rest.
+    """
+    existing = set(model.objects.values_list(*key_fields))
+    missing = [obj for obj in objs if tuple(getattr(obj, f) for f in key_fields) not in existing]
+    model.objects.bulk_create(missing, batch_size=500)
+
+
 class Command(BaseCommand):
     help = "Seed initial real-world data into the portfolio database"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Seed even if the database already holds portfolio data",
+        )
+
+    @transaction.atomic
     def handle(self, *args, **options):
+        # SiteSettings can't mark a seeded database: SiteSettings.load()
+        # creates the row on the first page view. Skills only come from
+        # here or the admin.
+        if not options["force"] and Skill.objects.exists():
+            self.stdout.write("Already seeded; use --force to re-run.")
+            return
+
+        done = []
+
         # Create superuser if not exists
         if not User.objects.filter(username="admin").exists():
             User.objects.create_superuser("admin", "admin@example.com", "admin123")
-            self.stdout.write(self.style.SUCCESS("✅ Created admin user (admin/admin123)"))
+            done.append("✅ Created admin user (admin/admin123)")
 
         # === Site Settings ===
         site, _ = SiteSettings.objects.get_or_create(
@@ -32,154 +112,118 @@ class Command(BaseCommand):
                 "happy_clients": 30,
             },
         )
-        self.stdout.write(self.style.SUCCESS("✅ Site settings created/updated"))
+        done.append("✅ Site settings created/updated")
 
         # === Skills ===
-        skills = [
-            ("Python", "backend", 95, "fab fa-python"),
-            ("Django", "backend", 90, "fab fa-python"),
-            ("React", "frontend", 80, "fab fa-react"),
-            ("HTML5", "frontend", 95, "fab fa-html5"),
-            ("CSS3", "frontend", 90, "fab fa-css3-alt"),
-            ("JavaScript", "frontend", 85, "fab fa-js"),
-            ("Docker", "devops", 70, "fab fa-docker"),
-            ("PostgreSQL", "database", 80, "fas fa-database"),
-            ("Git & GitHub", "tools", 95, "fab fa-git-alt"),
-            ("Machine Learning", "other", 85, "fas fa-brain"),
-        ]
-
-        for name, cat, prof, icon in skills:
-            Skill.objects.get_or_create(
+        create_missing(Skill, [
+            Skill(
                 name=name,
-                defaults={
-                    "category": cat,
-                    "proficiency": prof,
-                    "icon_class": icon,
-                    "description": f"Proficient in {name} development and integration.",
-                },
+                category=cat,
+                proficiency=prof,
+                icon_class=icon,
+                description=f"Proficient in {name} development and integration.",
             )
-        self.stdout.write(self.style.SUCCESS("✅ Skills seeded"))
+            for name, cat, prof, icon in SKILLS
+        ], "name")
+        done.append("✅ Skills seeded")
 
         # === Experience ===
-        Experience.objects.get_or_create(
-            title="Software Developer Intern",
-            company="Harambee House, ICT Department",
-            start_date="2024-10-01",
-            end_date="2024-12-31",
-            defaults={
-                "location": "Nairobi, Kenya",
-                "employment_type": "internship",
-                "description": "<p>Enhanced network performance and security.</p>",
-                "technologies": "Python, Django, Networking, Git",
-            },
-        )
-        Experience.objects.get_or_create(
-            title="Web Developer",
-            company="Zetech University",
-            start_date="2023-01-01",
-            end_date="2024-01-01",
-            defaults={
-                "location": "Nairobi, Kenya",
-                "employment_type": "contract",
-                "description": "<p>Developed student result management system.</p>",
-                "technologies": "Django, HTML, Bootstrap, CSS",
-            },
-        )
-        self.stdout.write(self.style.SUCCESS("✅ Experience seeded"))
+        create_missing(Experience, [
+            Experience(
+                title="Software Developer Intern",
+                company="Harambee House, ICT Department",
+                start_date=date(2024, 10, 1),
+                end_date=date(2024, 12, 31),
+                location="Nairobi, Kenya",
+                employment_type="internship",
+                description="<p>Enhanced network performance and security.</p>",
+                technologies="Python, Django, Networking, Git",
+            ),
+            Experience(
+                title="Web Developer",
+                company="Zetech University",
+                start_date=date(2023, 1, 1),
+                end_date=date(2024, 1, 1),
+                location="Nairobi, Kenya",
+                employment_type="contract",
+                description="<p>Developed student result management system.</p>",
+                technologies="Django, HTML, Bootstrap, CSS",
+            ),
+        ], "title", "company")
+        done.append("✅ Experience seeded")
 
         # === Education ===
-        Education.objects.get_or_create(
-            degree="Bachelor of Science",
-            field_of_study="Information Technology",
-            institution="Zetech University",
-            start_date="2020-01-01",
-            end_date="2024-01-01",
-            defaults={"description": "Focused on software engineering and networking."},
-        )
-        Education.objects.get_or_create(
-            degree="Short Course",
-            field_of_study="CCNA & Ethical Hacking",
-            institution="Zetech University",
-            start_date="2024-04-01",
-            end_date="2024-09-01",
-            defaults={"description": "Gained skills in networking and cybersecurity."},
-        )
-        self.stdout.write(self.style.SUCCESS("✅ Education seeded"))
+        create_missing(Education, [
+            Education(
+                degree="Bachelor of Science",
+                field_of_study="Information Technology",
+                institution="Zetech University",
+                start_date=date(2020, 1, 1),
+                end_date=date(2024, 1, 1),
+                description="Focused on software engineering and networking.",
+            ),
+            Education(
+                degree="Short Course",
+                field_of_study="CCNA & Ethical Hacking",
+                institution="Zetech University",
+                start_date=date(2024, 4, 1),
+                end_date=date(2024, 9, 1),
+                description="Gained skills in networking and cybersecurity.",
+            ),
+        ], "degree", "field_of_study", "institution")
+        done.append("✅ Education seeded")
 
         # === Certifications ===
-        Certification.objects.get_or_create(
-            name="CCNA",
-            issuing_organization="Cisco",
-            issue_date="2024-05-12",
-            defaults={"description": "Network installation and troubleshooting."},
-        )
-        Certification.objects.get_or_create(
-            name="Ethical Hacking Training",
-            issuing_organization="Zetech University",
-            issue_date="2024-09-01",
-            defaults={"description": "Practical ethical hacking fundamentals."},
-        )
-        self.stdout.write(self.style.SUCCESS("✅ Certifications seeded"))
-
-        # === Projects ===
-        projects = [
-            (
-                "Online Pharmacy System",
-                "fullstack",
-                "Django, PostgreSQL, Bootstrap, JavaScript",
-                "Built an online pharmacy platform with secure authentication and prescriptions.",
+        create_missing(Certification, [
+            Certification(
+                name="CCNA",
+                issuing_organization="Cisco",
+                issue_date=date(2024, 5, 12),
+                description="Network installation and troubleshooting.",
             ),
-            (
-                "Portfolio Website",
-                "fullstack",
-                "Django, HTML, CSS, Bootstrap, JavaScript",
-                "Personal portfolio showcasing projects, blogs, and achievements.",
+            Certification(
+                name="Ethical Hacking Training",
+                issuing_organization="Zetech University",
+                issue_date=date(2024, 9, 1),
+                description="Practical ethical hacking fundamentals.",
             ),
-            (
-                "Network Performance Dashboard",
-                "backend",
-                "Python, Django, REST API, Chart.js",
-                "Dashboard for visualizing network metrics and uptime reports.",
-            ),
-        ]
+        ], "name", "issuing_organization")
+        done.append("✅ Certifications seeded")
 
-        for title, cat, tech, desc in projects:
-            Project.objects.get_or_create(
+        # === Projects ===
+        # bulk_create skips save(), so slugs are filled in here; the unique
+        # slug lets ignore_conflicts skip rows seeded on a previous run.
+        Project.objects.bulk_create([
+            Project(
                 title=title,
-                defaults={
-                    "category": cat,
-                    "description": desc,
-                    "full_description": f"<p>{desc}</p>",
-                    "technologies": tech,
-                    "status": "completed",
-                },
+                slug=slugify(title),
+                category=cat,
+                description=desc,
+                full_description=f"<p>{desc}</p>",
+                technologies=tech,
+                status="completed",
             )
-        self.stdout.write(self.style.SUCCESS("✅ Projects seeded"))
+            for title, cat, tech, desc in PROJECTS
+        ], ignore_conflicts=True, batch_size=500)
+        done.append("✅ Projects seeded")
 
         # === Tags ===
-        tags = ["django", "ml", "ai", "react", "python", "fullstack"]
-        for tag in tags:
-            Tag.objects.get_or_create(name=tag, slug=tag)
-        self.stdout.write(self.style.SUCCESS("✅ Tags added"))
+        Tag.objects.bulk_create([Tag(name=tag, slug=tag) for tag in TAGS], ignore_conflicts=True)
+        done.append("✅ Tags added")
 
         # === Services ===
-        services = [
-            ("Web Development", "Building secure, scalable web applications.", "fas fa-laptop-code", 300.00),
-            ("Machine Learning Solutions", "AI-driven analytics and prediction tools.", "fas fa-brain", 500.00),
-            ("API Development", "RESTful APIs for mobile and web platforms.", "fas fa-cogs", 250.00),
-            ("IT Consultation", "Expert advice for tech integration.", "fas fa-headset", 150.00),
-        ]
-
-        for title, short_desc, icon, price in services:
-            Service.objects.get_or_create(
+        Service.objects.bulk_create([
+            Service(
                 title=title,
-                defaults={
-                    "short_description": short_desc,
-                    "description": f"<p>{short_desc}</p>",
-                    "icon": icon,
-                    "starting_price": price,
-                },
+                slug=slugify(title),
+                short_description=short_desc,
+                description=f"<p>{short_desc}</p>",
+                icon=icon,
+                starting_price=price,
             )
-        self.stdout.write(self.style.SUCCESS("✅ Services seeded"))
+            for title, short_desc, icon, price in SERVICES
+        ], ignore_conflicts=True, batch_size=500)
+        done.append("✅ Services seeded")
 
-        self.stdout.write(self.style.SUCCESS("🎉 All portfolio data loaded successfully!"))
+        done.append("🎉 All portfolio data loaded successfully!")
+        self.stdout.write(self.style.SUCCESS("\n".join(done)))
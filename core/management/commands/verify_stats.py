@@ -58,7 +58,7 @@ To ensure your stats are working correctly and pulling from the database:
 
 from django.core.management.base import BaseCommand
 from core.models import SiteSettings, Project, BlogPost, Skill
-from django.db.models import Sum
+from django.db.models import Count, Q, Sum
 
 
 class Command(BaseCommand):
@@ -71,9 +71,13 @@ class Command(BaseCommand):
             site_settings = SiteSettings.load()
             
             # Database stats
-            completed_projects = Project.objects.filter(status='completed').count()
+            project_stats = Project.objects.aggregate(
+                completed=Count('pk', filter=Q(status='completed')),
+                total_views=Sum('views'),
+            )
+            completed_projects = project_stats['completed']
             published_posts = BlogPost.objects.filter(status='published').count()
-            total_views = Project.objects.aggregate(total=Sum('views'))['total'] or 0
+            total_views = project_stats['total_views'] or 0
             active_techs = Skill.objects.filter(is_active=True).count()
             
             self.stdout.write(self.style.SUCCESS('✓ Database Values:\n'))
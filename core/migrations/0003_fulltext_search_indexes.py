@@ -0,0 +1,45 @@
+# GIN expression indexes backing core/search.py full-text search.
+#
+# PostgreSQL only: other backends keep their icontains fallback and this
+# migration is a no-op there. The expressions must match the SearchVector
+# built by core.search.full_text_search for the planner to use the index.
+
+from django.db import migrations
+
+SEARCH_INDEXES = [
+    ('project', 'core_project_search_gin', ('title', 'description', 'technologies', 'client')),
+    ('blogpost', 'core_blogpost_search_gin', ('title', 'excerpt', 'content')),
+    ('contactmessage', 'core_contactmsg_search_gin', ('name', 'email', 'subject', 'message')),
+]
+
+
+def _search_index(name, fields):
+    from django.contrib.postgres.indexes import GinIndex
+    from django.contrib.postgres.search import SearchVector
+
+    return GinIndex(SearchVector(*fields, config='english'), name=name)
+
+
+def create_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for model_name, name, fields in SEARCH_INDEXES:
+        schema_editor.add_index(apps.get_model('core', model_name), _search_index(name, fields))
+
+
+def drop_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for model_name, name, fields in SEARCH_INDEXES:
+        schema_editor.remove_index(apps.get_model('core', model_name), _search_index(name, fields))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_achievement_is_verified_achievement_tags_text_and_more'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 5.0.1 on 2026-10-15 22:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_fulltext_search_indexes'),
+        ('taggit', '0006_rename_taggeditem_content_type_object_id_taggit_tagg_content_8fc721_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='blogcomment',
+            index=models.Index(fields=['is_approved', 'created_at'], name='core_blogco_is_appr_b8e121_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contactmessage',
+            index=models.Index(fields=['is_read', '-created_at'], name='core_contac_is_read_67cbaf_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='newsletter',
+            index=models.Index(fields=['is_active', '-subscribed_at'], name='core_newsle_is_acti_5f0589_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['status', 'category'], name='core_projec_status_8dd002_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='skill',
+            index=models.Index(fields=['-featured', 'order', 'name'], name='core_skill_feature_dd7c6f_idx'),
+        ),
+    ]
@@ -0,0 +1,36 @@
+# Generated by Django 5.0.1 on 2026-10-15 22:19
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_admin_filter_indexes'),
+        ('taggit', '0006_rename_taggeditem_content_type_object_id_taggit_tagg_content_8fc721_idx'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='blogpost',
+            name='core_blogpo_status_80cc65_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='project',
+            name='core_projec_status_04c5d0_idx',
+        ),
+        migrations.AddIndex(
+            model_name='blogpost',
+            index=models.Index(fields=['status', '-published_date', '-created_at'], name='core_blogpo_status_d76f21_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['status', '-featured', 'order', '-created_at'], name='core_projec_status_4fd9b5_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='project',
+            index=models.Index(fields=['-featured', 'order', '-created_at'], name='core_projec_feature_40669a_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.0.1 on 2026-10-15 22:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_ordering_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='service',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['-featured', 'order'], name='service_active_pidx'),
+        ),
+        migrations.AddIndex(
+            model_name='skill',
+            index=models.Index(condition=models.Q(('is_active', True)), fields=['category', '-proficiency'], name='skill_active_pidx'),
+        ),
+        migrations.AddIndex(
+            model_name='testimonial',
+            index=models.Index(condition=models.Q(('is_approved', True), ('is_featured', True)), fields=['order', '-created_at'], name='testimonial_featured_pidx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.0.1 on 2026-10-15 22:35
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_partial_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='project',
+            name='milestone_notified',
+            field=models.IntegerField(default=0, editable=False, help_text='Highest view milestone already e-mailed'),
+        ),
+    ]
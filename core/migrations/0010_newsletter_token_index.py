@@ -0,0 +1,18 @@
+# Generated by Django 5.0.1 on 2026-10-15 23:01
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0009_project_created_sort_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='newsletter',
+            name='verification_token',
+            field=models.CharField(blank=True, db_index=True, max_length=100),
+        ),
+    ]
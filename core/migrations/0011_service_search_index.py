@@ -0,0 +1,38 @@
+# GIN expression index for searching services with core/search.py.
+#
+# Same scheme as 0003: PostgreSQL only, and the expression must match
+# search.SERVICE_SEARCH_FIELDS for the planner to use the index.
+
+from django.db import migrations
+
+SERVICE_FIELDS = ('title', 'short_description', 'description')
+
+
+def _search_index():
+    from django.contrib.postgres.indexes import GinIndex
+    from django.contrib.postgres.search import SearchVector
+
+    return GinIndex(SearchVector(*SERVICE_FIELDS, config='english'), name='core_service_search_gin')
+
+
+def create_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.add_index(apps.get_model('core', 'service'), _search_index())
+
+
+def drop_search_index(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.remove_index(apps.get_model('core', 'service'), _search_index())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0010_newsletter_token_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,29 @@
+# Mark milestones already passed before 0007 added milestone_notified.
+#
+# Without this every existing project past 100 views would e-mail the admin
+# on its first detail view after deploy. Milestones are copied from
+# core.tasks.VIEW_MILESTONES as they stood when this migration was written.
+
+from django.db import migrations
+
+VIEW_MILESTONES = (100, 500, 1000, 5000, 10000)
+
+
+def backfill_milestones(apps, schema_editor):
+    Project = apps.get_model('core', 'project')
+    # Ascending, so each row ends on the highest milestone <= its views
+    for milestone in VIEW_MILESTONES:
+        Project.objects.filter(
+            views__gte=milestone, milestone_notified__lt=milestone
+        ).update(milestone_notified=milestone)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0011_service_search_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(backfill_milestones, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,21 @@
+# Generated by Django 5.0.1 on 2026-10-15 23:32
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0012_backfill_milestone_notified'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='blogpost',
+            name='core_blogpo_views_f84cc2_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='project',
+            name='core_projec_views_18131b_idx',
+        ),
+    ]
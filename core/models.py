@@ -1,15 +1,40 @@
 from django.db import models
+from django.db.models import Q
+from django.core.cache import cache
 from django.utils.text import slugify
 from django.urls import reverse
 from django.core.validators import MinValueValidator, MaxValueValidator, FileExtensionValidator
 from ckeditor_uploader.fields import RichTextUploadingField
 from taggit.managers import TaggableManager
 from django.utils import timezone
+from django.utils.functional import cached_property
 from django.contrib.auth.models import User
-from PIL import Image
-from io import BytesIO
-from django.core.files.uploadedfile import InMemoryUploadedFile
-import sys
+from dateutil.relativedelta import relativedelta
+import re
+import secrets
+
+from .imageops import resize_encode
+from .viewcounts import record_view
+
+# Markup is dropped before counting words for BlogPost.reading_time
+_TAG_RE = re.compile(r'<[^>]+>')
+
+
+def _saves_field(kwargs, name):
+    """False when save() was called with update_fields that leave out `name`."""
+    update_fields = kwargs.get('update_fields')
+    return update_fields is None or name in update_fields
+
+
+def _include_update_fields(kwargs, *names):
+    """Add fields filled in by save() to the caller's update_fields, if any."""
+    if kwargs.get('update_fields') is not None:
+        kwargs['update_fields'] = {*kwargs['update_fields'], *names}
+
+
+def _forget_absolute_url(instance):
+    """Drop a cached absolute_url; the save may have changed the slug."""
+    instance.__dict__.pop('absolute_url', None)
 
 
 class TimeStampedModel(models.Model):
@@ -81,6 +106,12 @@ class SiteSettings(models.Model):
     
     updated_at = models.DateTimeField(auto_now=True)
     
+    # load() serves the singleton from the cache; save()/delete() drop the
+    # entry. The cache is per-process, so the TTL bounds how long other
+    # workers can serve settings that were edited elsewhere.
+    CACHE_KEY = 'site_settings_v2'
+    CACHE_TTL = 30
+    
     class Meta:
         verbose_name = "Site Settings"
         verbose_name_plural = "Site Settings"
@@ -92,32 +123,28 @@ class SiteSettings(models.Model):
         # Ensure only one instance exists
         self.pk = 1
         
-        # Optimize profile image
-        if self.profile_image:
-            img = Image.open(self.profile_image)
-            if img.mode in ('RGBA', 'LA', 'P'):
-                img = img.convert('RGB')
-            
-            # Resize to 500x500
-            output_size = (500, 500)
-            img.thumbnail(output_size, Image.Resampling.LANCZOS)
-            
-            # Save to BytesIO
-            output = BytesIO()
-            img.save(output, format='JPEG', quality=85, optimize=True)
-            output.seek(0)
-            
-            # Replace the image
-            self.profile_image = InMemoryUploadedFile(
-                output, 'ImageField', f"{self.profile_image.name.split('.')[0]}.jpg",
-                'image/jpeg', sys.getsizeof(output), None
+        # Optimize a newly uploaded profile image; a stored file was
+        # already processed when it was uploaded
+        if (self.profile_image and not self.profile_image._committed
+                and _saves_field(kwargs, 'profile_image')):
+            self.profile_image = resize_encode(
+                self.profile_image, (500, 500),
+                f"{self.profile_image.name.split('.')[0]}.jpg", quality=85
             )
         
         super().save(*args, **kwargs)
+        cache.delete(self.CACHE_KEY)
+    
+    def delete(self, *args, **kwargs):
+        cache.delete(self.CACHE_KEY)
+        return super().delete(*args, **kwargs)
     
     @classmethod
     def load(cls):
-        obj, created = cls.objects.get_or_create(pk=1)
+        obj = cache.get(cls.CACHE_KEY)
+        if obj is None:
+            obj, created = cls.objects.get_or_create(pk=1)
+            cache.set(cls.CACHE_KEY, obj, cls.CACHE_TTL)
         return obj
 
 
@@ -134,6 +161,7 @@ class Skill(TimeStampedModel):
         ('soft_skills', 'Soft Skills'),
         ('other', 'Other'),
     ]
+    CATEGORY_LABELS = dict(CATEGORY_CHOICES)
     
     name = models.CharField(max_length=100)
     category = models.CharField(max_length=20, choices=CATEGORY_CHOICES, db_index=True)
@@ -156,10 +184,19 @@ class Skill(TimeStampedModel):
         verbose_name_plural = "Skills"
         indexes = [
             models.Index(fields=['category', 'is_active']),
+            models.Index(fields=['-featured', 'order', 'name']),
+            # Partial: about/home only ever list active skills
+            models.Index(fields=['category', '-proficiency'], name='skill_active_pidx',
+                         condition=Q(is_active=True)),
         ]
     
     def __str__(self):
-        return f"{self.name} ({self.get_category_display()})"
+        return f"{self.name} ({self.category_display})"
+    
+    @property
+    def category_display(self):
+        """Dict lookup in place of get_category_display()'s choices scan."""
+        return self.CATEGORY_LABELS.get(self.category, self.category)
 
 
 class Experience(TimeStampedModel):
@@ -192,18 +229,17 @@ class Experience(TimeStampedModel):
     def __str__(self):
         return f"{self.title} at {self.company}"
     
-    @property
+    @cached_property
     def duration(self):
-        end = self.end_date or timezone.now().date()
-        delta = end - self.start_date
-        years = delta.days // 365
-        months = (delta.days % 365) // 30
+        end = self.end_date or timezone.localdate()
+        delta = relativedelta(end, self.start_date)
+        years, months = delta.years, delta.months
         
         if years > 0:
             return f"{years} year{'s' if years > 1 else ''} {months} month{'s' if months > 1 else ''}"
         return f"{months} month{'s' if months > 1 else ''}"
     
-    @property
+    @cached_property
     def tech_list(self):
         return [tech.strip() for tech in self.technologies.split(',')] if self.technologies else []
 
@@ -257,10 +293,16 @@ class Certification(TimeStampedModel):
     @property
     def is_expired(self):
         if self.expiry_date:
-            return self.expiry_date < timezone.now().date()
+            return self.expiry_date < timezone.localdate()
         return False
 
 
+class ProjectQuerySet(models.QuerySet):
+    def cards(self):
+        """Projects for list pages and widgets, without the full write-up."""
+        return self.defer('full_description')
+
+
 class Project(TimeStampedModel):
     """Portfolio projects"""
     STATUS_CHOICES = [
@@ -279,6 +321,7 @@ class Project(TimeStampedModel):
         ('design', 'Design'),
         ('other', 'Other'),
     ]
+    CATEGORY_LABELS = dict(CATEGORY_CHOICES)
     
     title = models.CharField(max_length=200)
     slug = models.SlugField(unique=True, blank=True, max_length=200)
@@ -306,19 +349,27 @@ class Project(TimeStampedModel):
     order = models.IntegerField(default=0, db_index=True)
     views = models.IntegerField(default=0, db_index=True)
     likes = models.IntegerField(default=0)
+    milestone_notified = models.IntegerField(
+        default=0, editable=False, help_text="Highest view milestone already e-mailed"
+    )
     
     # SEO
     meta_description = models.CharField(max_length=160, blank=True)
     
     tags = TaggableManager(blank=True)
     
+    objects = ProjectQuerySet.as_manager()
+    
     class Meta:
         ordering = ['-featured', 'order', '-created_at']
         verbose_name = "Project"
         verbose_name_plural = "Projects"
         indexes = [
-            models.Index(fields=['status', 'featured']),
-            models.Index(fields=['-views']),
+            models.Index(fields=['status', '-featured', 'order', '-created_at']),
+            models.Index(fields=['-featured', 'order', '-created_at']),
+            models.Index(fields=['status', 'category']),
+            models.Index(fields=['status', '-views']),
+            models.Index(fields=['status', '-created_at']),
         ]
     
     def __str__(self):
@@ -327,31 +378,45 @@ class Project(TimeStampedModel):
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = slugify(self.title)
+            _include_update_fields(kwargs, 'slug')
         
-        # Create thumbnail if not exists
-        if self.featured_image and not self.thumbnail:
-            img = Image.open(self.featured_image)
-            if img.mode in ('RGBA', 'LA', 'P'):
-                img = img.convert('RGB')
-            
-            output_size = (400, 300)
-            img.thumbnail(output_size, Image.Resampling.LANCZOS)
-            
-            output = BytesIO()
-            img.save(output, format='JPEG', quality=85, optimize=True)
-            output.seek(0)
-            
-            self.thumbnail = InMemoryUploadedFile(
-                output, 'ImageField', f"thumb_{self.featured_image.name.split('/')[-1]}",
-                'image/jpeg', sys.getsizeof(output), None
-            )
+        # Create thumbnail if missing or the featured image was replaced
+        if (self.featured_image and (not self.thumbnail or not self.featured_image._committed)
+                and _saves_field(kwargs, 'featured_image')):
+            self.thumbnail = self.make_thumbnail()
+            _include_update_fields(kwargs, 'thumbnail')
         
         super().save(*args, **kwargs)
+        _forget_absolute_url(self)
     
-    def get_absolute_url(self):
+    def make_thumbnail(self):
+        """Card-sized JPEG of featured_image, ready to assign to thumbnail."""
+        return resize_encode(
+            self.featured_image, (400, 300),
+            f"thumb_{self.featured_image.name.split('/')[-1]}", quality=78
+        )
+    
+    @cached_property
+    def absolute_url(self):
         return reverse('project_detail', kwargs={'slug': self.slug})
     
+    def get_absolute_url(self):
+        return self.absolute_url
+    
+    @classmethod
+    def bump_views(cls, pk):
+        """
+        Add one view, without a read or a save(); written in batches.
+
+        Returns the views not yet in the row, see viewcounts.record_view().
+        """
+        return record_view(cls, pk)
+    
     @property
+    def category_display(self):
+        return self.CATEGORY_LABELS.get(self.category, self.category)
+    
+    @cached_property
     def tech_list(self):
         return [tech.strip() for tech in self.technologies.split(',')]
 
@@ -372,6 +437,22 @@ class ProjectGallery(models.Model):
         return f"{self.project.title} - Image {self.order}"
 
 
+class BlogPostQuerySet(models.QuerySet):
+    # auth_user columns a byline never shows (it only needs the names)
+    BYLINE_DEFERRED = tuple(f'author__{field}' for field in (
+        'password', 'email', 'last_login', 'date_joined',
+        'is_superuser', 'is_staff', 'is_active',
+    ))
+
+    def cards(self):
+        """Posts for list pages and widgets, without the article body."""
+        return self.defer('content')
+
+    def with_byline(self):
+        """Join the author for the byline, loading only their name columns."""
+        return self.select_related('author').defer(*self.BYLINE_DEFERRED)
+
+
 class BlogPost(TimeStampedModel):
     """Blog posts and articles"""
     STATUS_CHOICES = [
@@ -406,13 +487,15 @@ class BlogPost(TimeStampedModel):
     
     tags = TaggableManager(blank=True)
     
+    objects = BlogPostQuerySet.as_manager()
+    
     class Meta:
         ordering = ['-published_date', '-created_at']
         verbose_name = "Blog Post"
         verbose_name_plural = "Blog Posts"
         indexes = [
-            models.Index(fields=['status', 'published_date']),
-            models.Index(fields=['-views']),
+            models.Index(fields=['status', '-published_date', '-created_at']),
+            models.Index(fields=['status', '-views']),
         ]
     
     def __str__(self):
@@ -421,18 +504,35 @@ class BlogPost(TimeStampedModel):
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = slugify(self.title)
+            _include_update_fields(kwargs, 'slug')
         if self.status == 'published' and not self.published_date:
             self.published_date = timezone.now()
+            _include_update_fields(kwargs, 'published_date')
         
         # Auto-calculate reading time from content
-        if self.content:
-            words = len(self.content.split())
+        if self.content and _saves_field(kwargs, 'content'):
+            words = len(_TAG_RE.sub(' ', self.content).split())
             self.reading_time = max(1, round(words / 200))  # Average reading speed
+            _include_update_fields(kwargs, 'reading_time')
         
         super().save(*args, **kwargs)
+        _forget_absolute_url(self)
     
-    def get_absolute_url(self):
+    @cached_property
+    def absolute_url(self):
         return reverse('blog_detail', kwargs={'slug': self.slug})
+    
+    def get_absolute_url(self):
+        return self.absolute_url
+    
+    @classmethod
+    def bump_views(cls, pk):
+        """
+        Add one view, without a read or a save(); written in batches.
+
+        Returns the views not yet in the row, see viewcounts.record_view().
+        """
+        return record_view(cls, pk)
 
 
 class BlogComment(TimeStampedModel):
@@ -451,6 +551,11 @@ class BlogComment(TimeStampedModel):
         ordering = ['created_at']
         verbose_name = "Blog Comment"
         verbose_name_plural = "Blog Comments"
+        indexes = [
+            models.Index(fields=['is_approved', 'created_at']),
+            # A post's approved thread, oldest first (blog detail page)
+            models.Index(fields=['post', 'is_approved', 'created_at']),
+        ]
     
     def __str__(self):
         return f"Comment by {self.name} on {self.post.title}"
@@ -479,6 +584,10 @@ class Testimonial(TimeStampedModel):
         ordering = ['-is_featured', 'order', '-created_at']
         verbose_name = "Testimonial"
         verbose_name_plural = "Testimonials"
+        indexes = [
+            models.Index(fields=['order', '-created_at'], name='testimonial_featured_pidx',
+                         condition=Q(is_featured=True, is_approved=True)),
+        ]
     
     def __str__(self):
         return f"{self.name} - {self.company}"
@@ -514,6 +623,7 @@ class ContactMessage(TimeStampedModel):
         verbose_name_plural = "Contact Messages"
         indexes = [
             models.Index(fields=['is_read', 'is_responded']),
+            models.Index(fields=['is_read', '-created_at']),
         ]
     
     def __str__(self):
@@ -527,18 +637,36 @@ class Newsletter(TimeStampedModel):
     is_active = models.BooleanField(default=True, db_index=True)
     subscribed_at = models.DateTimeField(auto_now_add=True, db_index=True)
     unsubscribed_at = models.DateTimeField(null=True, blank=True)
-    verification_token = models.CharField(max_length=100, blank=True)
+    verification_token = models.CharField(max_length=100, blank=True, db_index=True)
     is_verified = models.BooleanField(default=False)
     ip_address = models.GenericIPAddressField(null=True, blank=True)
     source = models.CharField(max_length=50, blank=True, help_text="Where they subscribed from")
     
+    # Verification tokens are token_urlsafe(TOKEN_BYTES), so always
+    # TOKEN_LENGTH characters; newsletter_verify rejects any other length
+    TOKEN_BYTES = 32
+    TOKEN_LENGTH = len(secrets.token_urlsafe(TOKEN_BYTES))
+    
     class Meta:
         ordering = ['-subscribed_at']
         verbose_name = "Newsletter Subscription"
         verbose_name_plural = "Newsletter Subscriptions"
+        indexes = [
+            models.Index(fields=['is_active', '-subscribed_at']),
+        ]
     
     def __str__(self):
         return self.email
+    
+    @classmethod
+    def subscribers(cls):
+        """Active, verified subscriptions: who new-post mail goes to."""
+        return cls.objects.filter(is_active=True, is_verified=True)
+    
+    @classmethod
+    def new_verification_token(cls):
+        """Random token for a verification link, TOKEN_LENGTH characters."""
+        return secrets.token_urlsafe(cls.TOKEN_BYTES)
 
 
 class Achievement(TimeStampedModel):
@@ -597,6 +725,11 @@ class Service(TimeStampedModel):
         ordering = ['order', 'title']
         verbose_name = "Service"
         verbose_name_plural = "Services"
+        indexes = [
+            # Footer menu on every page: active services by -featured, order
+            models.Index(fields=['-featured', 'order'], name='service_active_pidx',
+                         condition=Q(is_active=True)),
+        ]
 
     def __str__(self):
         return self.title
@@ -604,7 +737,9 @@ class Service(TimeStampedModel):
     def save(self, *args, **kwargs):
         if not self.slug:
             self.slug = slugify(self.title)
+            _include_update_fields(kwargs, 'slug')
         super().save(*args, **kwargs)
+        _forget_absolute_url(self)
 
     @property
     def deliverables_list(self):
@@ -627,9 +762,13 @@ class Service(TimeStampedModel):
             return [t.strip() for t in self.technologies.split(',')]
         return []
 
-    def get_absolute_url(self):
+    @cached_property
+    def absolute_url(self):
         return reverse('service_detail', kwargs={'slug': self.slug})
 
+    def get_absolute_url(self):
+        return self.absolute_url
+
 
 
 class FAQ(TimeStampedModel):
@@ -0,0 +1,93 @@
+"""
+Full-text search helpers.
+
+On PostgreSQL, searches are answered from the GIN expression indexes created
+in migration 0003 instead of one ILIKE '%term%' scan per column. Other
+backends (SQLite in development) fall back to icontains filters.
+"""
+import re
+
+from django.db import connections
+from django.db.models import Q
+
+SEARCH_CONFIG = 'english'
+
+# Only terms made of plain words get a prefix tsquery. The parser keeps
+# 'node.js', 'example.com' and e-mail addresses as single host/file/email
+# lexemes, which a query split on the punctuation can never match.
+_PLAIN_TERM_RE = re.compile(r'[^\W_]+(?:\s+[^\W_]+)*')
+
+# Columns covered by each model's GIN index. The query expression must match
+# the index expression exactly for PostgreSQL to use it, so keep these in
+# sync with migrations 0003 and 0011.
+PROJECT_SEARCH_FIELDS = ('title', 'description', 'technologies', 'client')
+BLOGPOST_SEARCH_FIELDS = ('title', 'excerpt', 'content')
+CONTACT_SEARCH_FIELDS = ('name', 'email', 'subject', 'message')
+SERVICE_SEARCH_FIELDS = ('title', 'short_description', 'description')  # migration 0011
+
+
+def uses_full_text_search(queryset):
+    return connections[queryset.db].vendor == 'postgresql'
+
+
+def prefix_tsquery(term):
+    """
+    Raw tsquery text matching every word of `term`, the last one as a
+    prefix, e.g. 'rest djang' -> 'rest & djang:*'. None unless `term` is
+    only letters, digits and spaces.
+    """
+    term = term.strip()
+    if not _PLAIN_TERM_RE.fullmatch(term):
+        return None
+    words = term.split()
+    return ' & '.join([*words[:-1], f'{words[-1]}:*'])
+
+
+def full_text_search(queryset, fields, term, prefix=False):
+    """
+    Filter `queryset` to rows whose `fields` match the search `term`.
+
+    With `prefix`, the last word also matches longer words ('djang'
+    finds 'Django'), for search-as-you-type; otherwise `term` is read
+    with websearch syntax (quotes, OR, -word). A prefix search for a term
+    with punctuation ('Node.js') uses websearch plus ILIKE instead, as
+    the parser's host/file lexemes only match whole.
+    """
+    if uses_full_text_search(queryset):
+        from django.contrib.postgres.search import SearchQuery, SearchVector
+
+        raw = prefix_tsquery(term) if prefix else None
+        if raw:
+            query = SearchQuery(raw, config=SEARCH_CONFIG, search_type='raw')
+        else:
+            query = SearchQuery(term, config=SEARCH_CONFIG, search_type='websearch')
+        matches = Q(_search=query)
+        if prefix and not raw:
+            matches |= contains_any(fields, term)
+        return queryset.alias(
+            _search=SearchVector(*fields, config=SEARCH_CONFIG)
+        ).filter(matches)
+
+    return queryset.filter(contains_any(fields, term))
+
+
+def contains_any(fields, term):
+    """Q matching rows where any of `fields` contains `term` (ILIKE)."""
+    condition = Q()
+    for field in fields:
+        condition |= Q(**{f'{field}__icontains': term})
+    return condition
+
+
+def search_with_tags(queryset, fields, term):
+    """
+    Prefix full_text_search() over `fields`, plus rows with a tag name
+    containing `term`.
+
+    Both matches are pk subqueries, so the tag join never reaches the outer
+    query and no DISTINCT is needed.
+    """
+    manager = queryset.model._default_manager
+    text_matches = full_text_search(manager.all(), fields, term, prefix=True).values('pk')
+    tag_matches = manager.filter(tags__name__icontains=term).values('pk')
+    return queryset.filter(Q(pk__in=text_matches) | Q(pk__in=tag_matches))
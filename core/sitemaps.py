@@ -21,7 +21,8 @@ class ProjectSitemap(Sitemap):
     priority = 0.7
     
     def items(self):
-        return Project.objects.filter(status='completed')
+        # Only the columns location() and lastmod() read
+        return Project.objects.filter(status='completed').only('slug', 'updated_at')
     
     def lastmod(self, obj):
         return obj.updated_at
@@ -33,7 +34,7 @@ class BlogPostSitemap(Sitemap):
     priority = 0.9
     
     def items(self):
-        return BlogPost.objects.filter(status='published')
+        return BlogPost.objects.filter(status='published').only('slug', 'updated_at')
     
     def lastmod(self, obj):
         return obj.updated_at
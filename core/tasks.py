@@ -0,0 +1,343 @@
+"""
+Background e-mail jobs for the receivers in core/signals.py.
+
+There is no task queue in this deployment (the Procfile runs gunicorn
+and nothing else), so jobs run on a small per-process thread pool and
+the request returns without waiting on SMTP. Receivers pass primary
+keys, not instances: each job re-fetches its rows on the worker thread's
+own connection, and enqueue() waits for the surrounding transaction to
+commit so those rows are visible.
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
+
+from django.core.mail import send_mail, EmailMultiAlternatives, get_connection
+from django.conf import settings
+from django.core.signing import Signer
+from django.db import connection, transaction
+from django.template.loader import render_to_string
+from django.urls import reverse
+
+from .models import ContactMessage, Newsletter, BlogPost, BlogComment, Project, SiteSettings
+
+logger = logging.getLogger(__name__)
+
+# Threads are only started on first submit, so each gunicorn worker gets
+# its own after the fork.
+_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='core-mail')
+
+# Migration 0012 backfilled milestone_notified from this set
+VIEW_MILESTONES = frozenset({100, 500, 1000, 5000, 10000})
+
+
+def enqueue(task, *args):
+    """Run task(*args) on the mail pool once the current transaction commits."""
+    # robust: a refused submit (pool shutting down) is logged, not raised
+    # into the request that has already committed
+    transaction.on_commit(lambda: _executor.submit(_run, task, *args), robust=True)
+
+
+def _batched(iterable, size):
+    """Yield lists of up to `size` items (itertools.batched is 3.12+)."""
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def _site_url():
+    """SITE_URL, read per job so override_settings reaches the mail."""
+    return settings.SITE_URL
+
+
+def _run(task, *args):
+    try:
+        task(*args)
+    finally:
+        # Worker threads hold their own connection; don't leak it
+        connection.close()
+
+
+def send_contact_notification(contact_id):
+    """Send notification to admin when new contact message is received"""
+    try:
+        instance = ContactMessage.objects.get(pk=contact_id)
+        site_url = _site_url()
+        site_settings = SiteSettings.load()
+
+        # Prepare email context
+        context = {
+            'contact': instance,
+            'site_settings': site_settings,
+            'admin_url': f"{site_url}/admin/core/contactmessage/{instance.id}/change/",
+        }
+
+        # Render HTML email
+        html_content = render_to_string('emails/contact_admin_notification.html', context)
+        text_content = f"""
+New Contact Message Received
+
+From: {instance.name}
+Email: {instance.email}
+Phone: {instance.phone or 'Not provided'}
+Subject: {instance.subject}
+
+Message:
+{instance.message}
+
+Budget: {instance.budget or 'Not specified'}
+Timeline: {instance.timeline or 'Not specified'}
+Priority: {instance.get_priority_display()}
+
+Received: {instance.created_at.strftime('%Y-%m-%d %H:%M:%S')}
+IP Address: {instance.ip_address}
+        """
+
+        # Send email
+        email = EmailMultiAlternatives(
+            subject=f"🔔 New Contact: {instance.subject}",
+            body=text_content,
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            to=[settings.ADMIN_EMAIL],
+        )
+        email.attach_alternative(html_content, "text/html")
+        email.send(fail_silently=True)
+
+    except Exception:
+        logger.exception("Error sending contact notification")
+
+
+def send_newsletter_welcome(newsletter_id):
+    """Send welcome email to new newsletter subscribers"""
+    try:
+        instance = Newsletter.objects.get(pk=newsletter_id)
+        site_url = _site_url()
+        site_settings = SiteSettings.load()
+        verify_path = reverse('newsletter_verify', args=[instance.verification_token])
+        # newsletter_unsubscribe only accepts a signed address
+        unsubscribe_path = reverse('newsletter_unsubscribe', args=[Signer().sign(instance.email)])
+
+        # Prepare email context
+        context = {
+            'newsletter': instance,
+            'site_settings': site_settings,
+            'verification_url': f"{site_url}{verify_path}",
+            'unsubscribe_url': f"{site_url}{unsubscribe_path}",
+        }
+
+        # Render HTML email
+        html_content = render_to_string('emails/newsletter_welcome.html', context)
+        text_content = f"""
+Welcome to {site_settings.site_name} Newsletter!
+
+Hi {instance.name or 'there'},
+
+Thank you for subscribing to my newsletter! You'll receive updates about:
+
+• New blog posts and technical articles
+• Latest projects and case studies
+• Web development tips and best practices
+• Industry insights and trends
+• Exclusive content for subscribers
+
+Please verify your email address to activate your subscription:
+{context.get('verification_url', 'Visit the website to verify')}
+
+Looking forward to sharing valuable content with you!
+
+Best regards,
+{site_settings.site_name}
+
+---
+To unsubscribe: {context.get('unsubscribe_url', 'Visit the website')}
+        """
+
+        # Send email
+        email = EmailMultiAlternatives(
+            subject=f"Welcome to {site_settings.site_name} Newsletter! 🎉",
+            body=text_content,
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            to=[instance.email],
+        )
+        email.attach_alternative(html_content, "text/html")
+        email.send(fail_silently=True)
+
+    except Exception:
+        logger.exception("Error sending welcome email")
+
+
+def send_new_post_notifications(post_id):
+    """Notify newsletter subscribers when a new blog post is published"""
+    try:
+        # Stream active, verified subscribers in bcc-sized batches rather
+        # than holding the whole list in memory
+        subscriber_emails = Newsletter.subscribers().values_list(
+            'email', flat=True
+        ).iterator(chunk_size=500)
+        batches = _batched(subscriber_emails, 50)
+
+        # Nobody to mail: skip the post/settings lookups and the rendering
+        first_batch = next(batches, None)
+        if first_batch is None:
+            return
+
+        instance = BlogPost.objects.select_related('author').get(pk=post_id)
+        site_url = _site_url()
+        site_settings = SiteSettings.load()
+
+        # Prepare email context
+        context = {
+            'post': instance,
+            'site_settings': site_settings,
+            'post_url': f"{site_url}{instance.get_absolute_url()}",
+        }
+
+        # Render HTML email
+        html_content = render_to_string('emails/new_post_notification.html', context)
+        text_content = f"""
+New Article Published on {site_settings.site_name}
+
+{instance.title}
+
+{instance.excerpt}
+
+Read the full article: {context.get('post_url', 'Visit the website')}
+
+Reading time: {instance.reading_time} minutes
+
+---
+You're receiving this because you subscribed to {site_settings.site_name} newsletter.
+        """
+
+        # One message per batch of bcc recipients, all sharing the bodies
+        # rendered above and sent over a single SMTP session
+        subject = f"📝 New Article: {instance.title}"
+        with get_connection(fail_silently=True) as mail_connection:
+            for batch in chain([first_batch], batches):
+                email = EmailMultiAlternatives(
+                    subject=subject,
+                    body=text_content,
+                    from_email=settings.DEFAULT_FROM_EMAIL,
+                    bcc=batch,
+                    connection=mail_connection,
+                )
+                email.attach_alternative(html_content, "text/html")
+                email.send(fail_silently=True)
+
+    except Exception:
+        logger.exception("Error notifying subscribers")
+
+
+def send_comment_notification(comment_id):
+    """Notify admin of new blog comment"""
+    try:
+        instance = BlogComment.objects.select_related('post', 'parent').get(pk=comment_id)
+        site_url = _site_url()
+        site_settings = SiteSettings.load()
+
+        context = {
+            'comment': instance,
+            'site_settings': site_settings,
+            'post_url': f"{site_url}{instance.post.get_absolute_url()}",
+        }
+
+        html_content = render_to_string('emails/comment_admin_notification.html', context)
+        text_content = f"""
+New Comment Pending Approval
+
+Post: {instance.post.title}
+Commenter: {instance.name} ({instance.email})
+
+Comment:
+{instance.content}
+
+Approve or reject: {context.get('post_url', 'Check admin panel')}
+        """
+
+        email = EmailMultiAlternatives(
+            subject=f"💬 New Comment on '{instance.post.title}'",
+            body=text_content,
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            to=[settings.ADMIN_EMAIL],
+        )
+        email.attach_alternative(html_content, "text/html")
+        email.send(fail_silently=True)
+
+    except Exception:
+        logger.exception("Error sending comment notification")
+
+
+def send_comment_reply_notification(comment_id):
+    """Notify original commenter when someone replies"""
+    try:
+        instance = BlogComment.objects.select_related('post', 'parent').get(pk=comment_id)
+        site_url = _site_url()
+        site_settings = SiteSettings.load()
+
+        parent_comment = instance.parent
+
+        context = {
+            'comment': instance,
+            'parent_comment': parent_comment,
+            'site_settings': site_settings,
+            'post_url': f"{site_url}{instance.post.get_absolute_url()}#comment-{instance.id}",
+        }
+
+        html_content = render_to_string('emails/comment_reply_notification.html', context)
+        text_content = f"""
+Someone Replied to Your Comment
+
+{instance.name} replied to your comment on "{instance.post.title}":
+
+{instance.content}
+
+View the conversation: {context.get('post_url', 'Visit the website')}
+        """
+
+        email = EmailMultiAlternatives(
+            subject=f"💬 Reply to your comment on '{instance.post.title}'",
+            body=text_content,
+            from_email=settings.DEFAULT_FROM_EMAIL,
+            to=[parent_comment.email],
+        )
+        email.attach_alternative(html_content, "text/html")
+        email.send(fail_silently=True)
+
+    except Exception:
+        logger.exception("Error sending reply notification")
+
+
+def send_project_milestone(project_id, milestone):
+    """Notify admin when project reaches view milestone"""
+    try:
+        # Claim the milestone first: only one caller can move the marker
+        # past it, so admin re-saves and concurrent views don't resend
+        claimed = Project.objects.filter(
+            pk=project_id, milestone_notified__lt=milestone
+        ).update(milestone_notified=milestone)
+        if not claimed:
+            return
+
+        instance = Project.objects.get(pk=project_id)
+        subject = f"🎉 Project Milestone: {instance.title} reached {milestone} views!"
+        message = f"""
+Congratulations! Your project "{instance.title}" has reached {milestone} views.
+
+Project Details:
+- Category: {instance.get_category_display()}
+- Status: {instance.get_status_display()}
+- Total Likes: {instance.likes}
+- Created: {instance.created_at.strftime('%Y-%m-%d')}
+
+Keep up the great work!
+        """
+
+        send_mail(
+            subject,
+            message,
+            settings.DEFAULT_FROM_EMAIL,
+            [settings.ADMIN_EMAIL],
+            fail_silently=True,
+        )
+    except Exception:
+        logger.exception("Error sending milestone notification")
@@ -1,9 +1,16 @@
 # Create this file at: core/templatetags/service_extras.py
 
+from functools import lru_cache
+
 from django import template
 
 register = template.Library()
 
+@lru_cache(maxsize=1024)
+def _split_cached(value, arg):
+    # Tuple so the shared cached result can't be mutated by a caller
+    return tuple(item.strip() for item in value.split(arg) if item.strip())
+
 @register.filter
 def split(value, arg=','):
     """
@@ -11,8 +18,8 @@ def split(value, arg=','):
     Usage: {{ service.technologies|split:',' }}
     """
     if value:
-        return [item.strip() for item in str(value).split(arg) if item.strip()]
-    return []
+        return _split_cached(str(value), arg)
+    return ()
 
 @register.filter
 def multiply(value, arg):
@@ -20,6 +27,9 @@ def multiply(value, arg):
     Multiply value by arg
     Usage: {{ forloop.counter0|multiply:100 }}
     """
+    # forloop counters and int literals skip the conversions below
+    if type(value) is int and type(arg) is int:
+        return value * arg
     try:
         return int(value) * int(arg)
     except (ValueError, TypeError):
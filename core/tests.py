@@ -1,20 +1,88 @@
 """
 Tests for Brian Getenga Portfolio
 """
-from django.test import TestCase, Client
+import os
+import tempfile
+from datetime import date, timedelta
+from importlib import import_module
+from io import BytesIO
+from unittest import mock
+from urllib.parse import urlsplit
+
+from PIL import Image
+from django.apps import apps
+from django.core import mail, serializers
+from django.core.cache import cache
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.db import connection
+from django.http import HttpResponse
+from django.test import TestCase, Client, RequestFactory, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
+from django.utils import timezone
 from django.contrib.auth.models import User
+from core import tasks, viewcounts
+from core.checks import check_site_url
+from core.forms import ContactForm
 from core.models import (
     SiteSettings, Project, BlogPost, Skill, Experience,
-    Testimonial, ContactMessage, Newsletter, Service
+    Testimonial, ContactMessage, Newsletter, Service,
+    BlogComment, FAQ,
 )
+from core.search import PROJECT_SEARCH_FIELDS, full_text_search, prefix_tsquery
+from core.signals import DERIVED_CACHE_KEYS
+from core.views import get_tags_for_model, rate_limit_check
+
+
+def make_project(title, tags=(), **fields):
+    """Create a project, with placeholder text in the required fields"""
+    project = Project.objects.create(**{
+        'title': title, 'description': 'D', 'full_description': 'F',
+        'technologies': 'Django', **fields,
+    })
+    if tags:
+        project.tags.add(*tags)
+    return project
+
+
+def make_post(title, tags=(), **fields):
+    """Create a published post, with placeholder text in the required fields"""
+    post = BlogPost.objects.create(**{
+        'title': title, 'excerpt': 'Excerpt', 'content': '<p>Body</p>',
+        'status': 'published', **fields,
+    })
+    if tags:
+        post.tags.add(*tags)
+    return post
+
+
+def make_service(title, **fields):
+    """Create an active service, with placeholder text in the required fields"""
+    return Service.objects.create(**{
+        'title': title, 'short_description': 'S', 'description': 'D',
+        'icon': 'fas fa-code', **fields,
+    })
+
+
+class FreshCacheMixin:
+    """Start each test with an empty cache and no unwritten view counts"""
+
+    def setUp(self):
+        super().setUp()
+        # Keys such as proj_view_<pk>_<ip> outlive the rollback that frees
+        # the pk for the next test's rows
+        cache.clear()
+        self.addCleanup(cache.clear)
+        # Written inside the test's transaction, so rolled back with it
+        self.addCleanup(viewcounts.flush)
 
 
 class SiteSettingsTestCase(TestCase):
     """Test Site Settings model"""
     
-    def setUp(self):
-        self.settings = SiteSettings.load()
+    @classmethod
+    def setUpTestData(cls):
+        cls.settings = SiteSettings.load()
     
     def test_singleton_pattern(self):
         """Test that only one SiteSettings instance exists"""
@@ -26,13 +94,22 @@ class SiteSettingsTestCase(TestCase):
         """Test default values are set"""
         self.assertEqual(self.settings.site_name, "Brian Getenga Portfolio")
         self.assertEqual(self.settings.years_experience, 4)
+    
+    def test_load_is_cached_until_save(self):
+        """Test load() skips the database until settings are saved"""
+        with self.assertNumQueries(0):
+            SiteSettings.load()
+        self.settings.tagline = "Updated tagline"
+        self.settings.save()
+        self.assertEqual(SiteSettings.load().tagline, "Updated tagline")
 
 
 class ProjectTestCase(TestCase):
     """Test Project model"""
     
-    def setUp(self):
-        self.project = Project.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        cls.project = Project.objects.create(
             title="Test Project",
             description="Test Description",
             full_description="Full test description",
@@ -54,6 +131,53 @@ class ProjectTestCase(TestCase):
         tech_list = self.project.tech_list
         self.assertEqual(len(tech_list), 3)
         self.assertIn("Python", tech_list)
+    
+    def test_absolute_url_follows_slug_change(self):
+        """Test a saved slug change is reflected by the same instance's URL"""
+        project = make_project("Renamed")
+        self.assertIn("/renamed/", project.get_absolute_url())
+        project.slug = "new-name"
+        project.save()
+        self.assertIn("/new-name/", project.get_absolute_url())
+
+    def test_save_drops_cached_tag_list(self):
+        """Test saving a project clears the cached project tag cloud"""
+        cache.set('project_tags_v2', ['stale'])
+        self.project.save()
+        self.assertIsNone(cache.get('project_tags_v2'))
+
+    def test_bump_views_batches_writes(self):
+        """Test views are tallied in memory and written in one UPDATE"""
+        other = make_project("Other", technologies="Go")
+        # Write out anything tallied by earlier tests, then measure from here
+        viewcounts.flush()
+        before = dict(Project.objects.values_list('pk', 'views'))
+        with override_settings(VIEW_COUNT_FLUSH_SECONDS=3600), self.assertNumQueries(0):
+            unwritten = [
+                Project.bump_views(pk)
+                for pk in (self.project.pk, self.project.pk, other.pk)
+            ]
+        self.assertEqual(unwritten, [1, 2, 1])
+        with self.assertNumQueries(1):
+            viewcounts.flush()
+        after = dict(Project.objects.values_list('pk', 'views'))
+        self.assertEqual(
+            {pk: after[pk] - before[pk] for pk in after},
+            {self.project.pk: 2, other.pk: 1}
+        )
+
+
+class ExperienceTestCase(TestCase):
+    """Test Experience model"""
+    
+    def test_duration_uses_calendar_months(self):
+        """Test duration counts whole calendar years and months"""
+        exp = Experience(
+            title="Developer", company="Acme", description="Work",
+            start_date=date(2020, 1, 1), end_date=date(2023, 12, 31)
+        )
+        # 1460 days: day-count division used to report "4 years"
+        self.assertEqual(exp.duration, "3 years 11 months")
 
 
 class BlogPostTestCase(TestCase):
@@ -82,12 +206,36 @@ class BlogPostTestCase(TestCase):
         self.assertIsNotNone(self.post.published_date)
 
 
-class ViewsTestCase(TestCase):
+class UpdateFieldsTestCase(TestCase):
+    """Test save() overrides honour a caller's update_fields"""
+    
+    def test_published_date_saved_with_status(self):
+        """Test an auto-set published_date is written with a status-only save"""
+        post = make_post("Draft", content="Some words here", status="draft")
+        post.status = "published"
+        post.save(update_fields=["status"])
+        post.refresh_from_db()
+        self.assertIsNotNone(post.published_date)
+    
+    def test_status_only_save_skips_reading_time(self):
+        """Test a save that doesn't write content doesn't recount its words"""
+        post = make_post("Draft", content="Some words here", status="draft")
+        post.content = "word " * 1000  # unsaved edit
+        post.status = "published"
+        post.save(update_fields=["status"])
+        self.assertEqual(post.reading_time, 1)
+
+
+class ViewsTestCase(FreshCacheMixin, TestCase):
     """Test views"""
     
+    @classmethod
+    def setUpTestData(cls):
+        cls.settings = SiteSettings.load()
+    
     def setUp(self):
+        super().setUp()
         self.client = Client()
-        self.settings = SiteSettings.load()
     
     def test_home_page(self):
         """Test home page loads"""
@@ -113,11 +261,268 @@ class ViewsTestCase(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'core/contact.html')
 
+    def test_home_sections_cached_until_content_saved(self):
+        """Test the cached home sections are re-rendered after a model save"""
+        self.client.get(reverse('home'))
+        # Page-view tracking aside, only the footer's service links (from
+        # base.html) are queried on a cached render
+        with mock.patch('core.views.track_page_view'), self.assertNumQueries(1):
+            self.client.get(reverse('home'))
+        FAQ.objects.create(question="Do you work remotely?", answer="Yes")
+        response = self.client.get(reverse('home'))
+        self.assertContains(response, "Do you work remotely?")
+
+    def test_about_sections_cached_until_content_saved(self):
+        """Test the about page reuses its cached sections until a skill is saved"""
+        skill = Skill.objects.create(
+            name="Django", category="backend", icon_class="fab fa-python", proficiency=90
+        )
+        response = self.client.get(reverse('about'))
+        self.assertContains(response, "Django")
+        self.assertContains(response, skill.category_display)
+        # Only the footer's services query remains
+        with self.assertNumQueries(1):
+            self.client.get(reverse('about'))
+        skill.name = "Django REST"
+        skill.save()
+        self.assertContains(self.client.get(reverse('about')), "Django REST")
+
+    def test_services_sections_cached_until_faq_saved(self):
+        """Test the services page reuses its cached sections until an FAQ is saved"""
+        faq = FAQ.objects.create(question="Do you host?", answer="Yes", order=1)
+        self.assertContains(self.client.get(reverse('services')), "Do you host?")
+        # Only the footer's services query remains
+        with self.assertNumQueries(1):
+            self.client.get(reverse('services'))
+        faq.question = "Do you offer hosting?"
+        faq.save()
+        self.assertContains(self.client.get(reverse('services')), "Do you offer hosting?")
+
+    def test_service_detail_related_prefers_featured(self):
+        """Test related services list featured ones first and skip the current one"""
+        current = make_service("Current", featured=True)
+        featured = make_service("Featured", featured=True)
+        plain = [make_service(f"Plain {i}") for i in range(3)]
+        make_service("Retired", featured=True, is_active=False)
+        response = self.client.get(reverse('service_detail', args=[current.slug]))
+        related = [s.pk for s in response.context['related_services']]
+        self.assertEqual(related[0], featured.pk)
+        self.assertEqual(len(related), 3)
+        self.assertTrue(set(related[1:]) <= {p.pk for p in plain})
+
+    def test_service_detail_skips_deactivated_related(self):
+        """Test a service deactivated without a save drops out of related services"""
+        current, other = make_service("Current"), make_service("Other")
+        url = reverse('service_detail', args=[current.slug])
+        self.client.get(url)  # caches the active id list
+        Service.objects.filter(pk=other.pk).update(is_active=False)
+        response = self.client.get(url)
+        self.assertEqual(response.context['related_services'], [])
+
+    def test_reload_shows_unwritten_views(self):
+        """Test a repeat visit shows the same total as the first, pending views included"""
+        project = make_project("Counted", views=5)
+        with override_settings(VIEW_COUNT_FLUSH_SECONDS=3600):
+            first = self.client.get(project.get_absolute_url())
+            again = self.client.get(project.get_absolute_url())
+        self.assertEqual(first.context['project'].views, 6)
+        self.assertEqual(again.context['project'].views, 6)
+        self.assertEqual(Project.objects.get(pk=project.pk).views, 5)
+
+    def test_resume_download_streams_local_file(self):
+        """Test a locally stored resume is streamed as a named attachment"""
+        with tempfile.TemporaryDirectory() as media_root, override_settings(MEDIA_ROOT=media_root):
+            site_settings = SiteSettings.load()
+            site_settings.resume_file = SimpleUploadedFile('cv.pdf', b'%PDF-1.4 resume')
+            site_settings.save()
+            response = self.client.get(reverse('download_resume'))
+            self.assertTrue(response.streaming)
+            self.assertEqual(b''.join(response.streaming_content), b'%PDF-1.4 resume')
+            self.assertIn('Brian_Getenga_Portfolio_Resume.pdf', response['Content-Disposition'])
+            response.close()
+
+    def test_blog_list_loads_only_byline_columns(self):
+        """Test the blog list joins the author's names but not their password hash"""
+        author = User.objects.create_user('byline', first_name='Ada', last_name='L', password='x')
+        make_post("Listed", author=author)
+        response = self.client.get(reverse('blog'))
+        self.assertContains(response, "Ada L")
+        listed = response.context['posts'][0]
+        self.assertIn('content', listed.get_deferred_fields())
+        self.assertIn('password', listed.author.get_deferred_fields())
+
+    def test_project_like_counts_once_per_session(self):
+        """Test a like returns the new count and a repeat like is refused"""
+        project = make_project("Liked", status="completed", likes=4)
+        url = reverse('project_like', kwargs={'slug': project.slug})
+        first = self.client.post(url).json()
+        second = self.client.post(url).json()
+        self.assertEqual((first['action'], first['likes']), ('liked', 5))
+        self.assertEqual((second['action'], second['likes']), ('already_liked', 5))
+        project.refresh_from_db()
+        self.assertEqual(project.likes, 5)
+
+    def test_projects_search_matches_text_and_tags(self):
+        """Test project search finds text and tag matches once each"""
+        by_text = make_project("Inventory API", description="Stock tracking", status="completed")
+        by_tag = make_project(
+            "Storefront", ["django", "django-rest"],
+            description="Shop", technologies="React", status="completed",
+        )
+        response = self.client.get(reverse('projects'), {'search': 'django'})
+        self.assertEqual(
+            sorted(p.pk for p in response.context['projects']),
+            sorted([by_text.pk, by_tag.pk])
+        )
+
+    def test_projects_list_etag_not_modified_until_change(self):
+        """Test the project list answers 304 until a project changes"""
+        project = make_project("Cached List", status="completed")
+        first = self.client.get(reverse('projects'))
+        etag = first['ETag']
+        again = self.client.get(reverse('projects'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(again.status_code, 304)
+        project.title = "Renamed Project"
+        project.save()
+        changed = self.client.get(reverse('projects'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(changed.status_code, 200)
+
+    def test_prefix_tsquery_matches_partial_last_word(self):
+        """Test search-as-you-type builds a prefix tsquery for plain words only"""
+        self.assertEqual(prefix_tsquery(" rest  djang "), "rest & djang:*")
+        for term in ("Node.js", "ASP.NET", "jane@example.com", "c++ & (x|!y)", " :*& "):
+            self.assertIsNone(prefix_tsquery(term))
+
+    def test_dotted_terms_fall_back_to_substring_match(self):
+        """Test a term Postgres parses as one host/file lexeme is also matched with ILIKE"""
+        found = make_project("API", technologies="Node.js, Express", status="completed")
+        make_project("Site", technologies="Django", status="completed")
+        with mock.patch('core.views.render', return_value=HttpResponse()) as render:
+            self.client.get(reverse('search'), {'q': 'Node.js'})
+        self.assertEqual([p.pk for p in render.call_args[0][2]['projects']], [found.pk])
+
+        # The Postgres query itself, compiled without running it
+        with mock.patch('core.search.uses_full_text_search', return_value=True):
+            dotted = str(full_text_search(Project.objects.all(), PROJECT_SEARCH_FIELDS, 'Node.js', prefix=True).query)
+            plain = str(full_text_search(Project.objects.all(), PROJECT_SEARCH_FIELDS, 'nod', prefix=True).query)
+        self.assertIn('websearch_to_tsquery', dotted)
+        self.assertIn('LIKE', dotted)
+        self.assertIn('nod:*', plain)
+        self.assertNotIn('LIKE', plain)
+
+    def test_search_repeats_reuse_cached_matches(self):
+        """Test a repeated search reloads its matches by pk until content changes"""
+        project = make_project("Inventory API", description="Stock", status="completed")
+        with mock.patch('core.views.render', return_value=HttpResponse()) as render:
+            self.client.get(reverse('search'), {'q': 'Inventory'})
+            # pk__in plus its tag prefetch; the empty post and service
+            # sections skip theirs
+            with self.assertNumQueries(2):
+                self.client.get(reverse('search'), {'q': '  inventory '})
+            self.assertEqual([p.pk for p in render.call_args[0][2]['projects']], [project.pk])
+            project.status = 'archived'
+            project.save()
+            self.client.get(reverse('search'), {'q': 'inventory'})
+            self.assertEqual(render.call_args[0][2]['projects'], [])
+
+    def test_projects_pages_stable_when_sort_values_tie(self):
+        """Test paging by views never repeats a project across pages"""
+        for i in range(13):
+            make_project(f"Tied {i}", status="completed", views=7)
+        seen = []
+        for page in (1, 2):
+            response = self.client.get(reverse('projects'), {'sort': '-views', 'page': page})
+            seen += [p.pk for p in response.context['projects']]
+        self.assertEqual(len(seen), 13)
+        self.assertEqual(len(set(seen)), 13)
+
+    def test_project_tag_counts_only_completed_projects(self):
+        """Test the project tag cloud counts completed projects only"""
+        for i, status in enumerate(("completed", "completed", "in_progress")):
+            make_project(f"Tagged {i}", tags=["python"], status=status)
+        make_project("Draft", tags=["cobol"], status="in_progress")
+        tags = get_tags_for_model(
+            Project, filter_kwargs={'status': 'completed'}, count_annotation='project_count'
+        )
+        self.assertEqual([(t.name, t.project_count) for t in tags], [("python", 2)])
+
+    def test_related_projects_rank_tag_overlap_before_category(self):
+        """Test related projects put shared tags first, then same category"""
+        completed = dict(status="completed")
+        current = make_project("Current", ["a", "b", "c"], category="api", **completed)
+        two_tags = make_project("Two Tags", ["a", "b"], category="web_app", views=5, **completed)
+        one_tag = make_project("One Tag", ["c"], category="web_app", views=100, **completed)
+        same_category = make_project("Same Category", category="api", views=50, **completed)
+        make_project("Unrelated", ["z"], category="design", views=500, **completed)
+        response = self.client.get(current.get_absolute_url())
+        self.assertEqual(
+            [p.pk for p in response.context['related_projects']],
+            [two_tags.pk, one_tag.pk, same_category.pk]
+        )
+
+    def test_related_posts_topped_up_with_latest(self):
+        """Test related posts rank shared tags first, then fill with recent posts"""
+        author = User.objects.create_user('writer', password='x')
+        now = timezone.now()
+        current = make_post("Current", ["django", "orm"], author=author, published_date=now)
+        both = make_post("Both Tags", ["django", "orm"], author=author,
+                         published_date=now - timedelta(days=30))
+        one = make_post("One Tag", ["orm"], author=author, published_date=now - timedelta(days=20))
+        latest = make_post("Latest Untagged", author=author, published_date=now - timedelta(days=1))
+        make_post("Older Untagged", author=author, published_date=now - timedelta(days=10))
+        response = self.client.get(current.get_absolute_url())
+        self.assertEqual(
+            [p.pk for p in response.context['related_posts']],
+            [both.pk, one.pk, latest.pk]
+        )
+
+    def test_blog_detail_prefetches_approved_replies_only(self):
+        """Test unapproved replies are not loaded with the comment thread"""
+        author = User.objects.create_user('writer', password='x')
+        post = make_post("Threaded", author=author)
+        comment = BlogComment.objects.create(
+            post=post, name="A", email="a@example.com", content="Top", is_approved=True
+        )
+        approved = BlogComment.objects.create(
+            post=post, parent=comment, name="B", email="b@example.com",
+            content="Yes", is_approved=True
+        )
+        BlogComment.objects.create(
+            post=post, parent=comment, name="C", email="c@example.com",
+            content="Pending", is_approved=False
+        )
+        response = self.client.get(post.get_absolute_url())
+        thread = list(response.context['comments'])
+        self.assertEqual([c.pk for c in thread], [comment.pk])
+        self.assertEqual([r.pk for r in thread[0].approved_replies], [approved.pk])
+        self.assertEqual(response.context['comment_count'], 2)
+
+    def test_comment_by_post_author_auto_approved(self):
+        """Test the post author's own comment skips moderation"""
+        author = User.objects.create_user('writer', email='writer@example.com', password='x')
+        post = make_post("Own Words", author=author)
+        # Post joined with its author, then the insert: reading the
+        # author's e-mail costs no extra query
+        with self.assertNumQueries(2):
+            self.client.post(
+                reverse('blog_comment_submit', args=[post.slug]),
+                {'name': 'Writer', 'email': 'writer@example.com', 'content': 'Thanks for reading'}
+            )
+        self.client.post(
+            reverse('blog_comment_submit', args=[post.slug]),
+            {'name': 'Guest', 'email': 'guest@example.com', 'content': 'Nice post'}
+        )
+        self.assertEqual(
+            dict(BlogComment.objects.values_list('name', 'is_approved')),
+            {'Writer': True, 'Guest': False}
+        )
 
-class ContactFormTestCase(TestCase):
+
+class ContactFormTestCase(FreshCacheMixin, TestCase):
     """Test contact form"""
     
     def setUp(self):
+        super().setUp()
         self.client = Client()
     
     def test_contact_form_submission(self):
@@ -138,11 +543,29 @@ class ContactFormTestCase(TestCase):
         self.assertEqual(message.name, 'Test User')
         self.assertEqual(message.email, 'test@example.com')
 
+    def test_spam_message_rejected(self):
+        """Test messages matching any spam pattern are rejected"""
+        form = ContactForm(data={
+            'name': 'Test User',
+            'email': 'test@example.com',
+            'subject': 'Hello',
+            'message': 'Congratulations, you won a PRIZE today!'
+        })
+        self.assertFalse(form.is_valid())
+        self.assertIn('message', form.errors)
+
+    def test_rate_limit_allows_limit_then_blocks(self):
+        """Test rate_limit_check lets `limit` attempts through in a window"""
+        request = RequestFactory().post('/contact/', REMOTE_ADDR='203.0.113.9')
+        results = [rate_limit_check(request, 'contact', limit=3) for _ in range(4)]
+        self.assertEqual(results, [False, False, False, True])
+
 
-class NewsletterTestCase(TestCase):
+class NewsletterTestCase(FreshCacheMixin, TestCase):
     """Test newsletter subscription"""
     
     def setUp(self):
+        super().setUp()
         self.client = Client()
     
     def test_newsletter_subscription(self):
@@ -172,11 +595,177 @@ class NewsletterTestCase(TestCase):
         # Should return error
         self.assertEqual(response.status_code, 400)
 
+    def test_verified_subscriber_not_duplicated(self):
+        """Test a verified subscriber is told they are already on the list"""
+        Newsletter.objects.create(email='test@example.com', is_active=True, is_verified=True)
+
+        response = self.client.post(reverse('newsletter_subscribe'), {'email': 'test@example.com'})
+
+        self.assertFalse(response.json()['success'])
+        self.assertEqual(Newsletter.objects.count(), 1)
+
+    def test_inactive_subscriber_reactivated(self):
+        """Test an unsubscribed email can subscribe again"""
+        Newsletter.objects.create(email='test@example.com', is_active=False)
+
+        response = self.client.post(reverse('newsletter_subscribe'), {'email': 'test@example.com'})
+
+        self.assertTrue(response.json()['success'])
+        self.assertEqual(Newsletter.objects.count(), 1)
+        self.assertTrue(Newsletter.objects.get().is_active)
+
+    def test_verify_link_works_once(self):
+        """Test a verification link verifies the subscriber and is then spent"""
+        token = Newsletter.new_verification_token()
+        subscriber = Newsletter.objects.create(email="verify@example.com", verification_token=token)
+        url = reverse('newsletter_verify', args=[token])
+        with self.assertNumQueries(1):
+            self.client.get(url)
+        subscriber.refresh_from_db()
+        self.assertTrue(subscriber.is_verified)
+        self.assertEqual(subscriber.verification_token, '')
+        response = self.client.get(url, follow=True)
+        self.assertContains(response, 'invalid or has already been used')
+        with self.assertNumQueries(0):
+            self.client.get(reverse('newsletter_verify', args=['short']))
+
 
-class AdminTestCase(TestCase):
+class EmailTasksTestCase(FreshCacheMixin, TestCase):
+    """Test signal e-mails are queued off the request thread"""
+    
+    def test_contact_email_queued_after_commit(self):
+        """Test a new contact message queues its notification on commit"""
+        with mock.patch.object(tasks._executor, 'submit') as submit:
+            with self.captureOnCommitCallbacks(execute=True):
+                msg = ContactMessage.objects.create(
+                    name='Jane', email='jane@example.com', subject='Hi', message='Hello there'
+                )
+                submit.assert_not_called()
+        submit.assert_called_once_with(tasks._run, tasks.send_contact_notification, msg.pk)
+    
+    def test_raw_fixture_save_queues_nothing(self):
+        """Test rows saved by loaddata don't trigger notification mail"""
+        now = timezone.now()
+        fixture = serializers.serialize('json', [ContactMessage(
+            pk=1, name='Jane', email='jane@example.com', subject='Hi', message='Hello there',
+            created_at=now, updated_at=now
+        )])
+        with mock.patch.object(tasks._executor, 'submit') as submit:
+            with self.captureOnCommitCallbacks(execute=True):
+                for obj in serializers.deserialize('json', fixture):
+                    obj.save()
+        submit.assert_not_called()
+    
+    def test_contact_notification_sends_email(self):
+        """Test the queued job re-fetches the message and sends it"""
+        msg = ContactMessage.objects.create(
+            name='Jane', email='jane@example.com', subject='Hi', message='Hello there'
+        )
+        tasks.send_contact_notification(msg.pk)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertIn('Hi', mail.outbox[0].subject)
+
+    def test_resubscribe_queues_one_welcome(self):
+        """Test a returning subscriber gets one queued welcome, not an inline send"""
+        Newsletter.objects.create(email='back@example.com', is_active=False)
+        with mock.patch.object(tasks._executor, 'submit') as submit:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.client.post(reverse('newsletter_subscribe'), {'email': 'back@example.com'})
+        self.assertEqual(len(mail.outbox), 0)
+        submit.assert_called_once_with(
+            tasks._run, tasks.send_newsletter_welcome, Newsletter.objects.get().pk
+        )
+
+    def test_welcome_unsubscribe_link_works(self):
+        """Test the welcome e-mail's unsubscribe link is a signed, working URL"""
+        subscriber = Newsletter.objects.create(email='new@example.com', verification_token='tok')
+        tasks.send_newsletter_welcome(subscriber.pk)
+        html = mail.outbox[0].alternatives[0][0]
+        url = next(
+            word.split('"')[1] for word in html.split()
+            if word.startswith('href=') and '/newsletter/unsubscribe/' in word
+        )
+        self.client.get(urlsplit(url).path)
+        subscriber.refresh_from_db()
+        self.assertFalse(subscriber.is_active)
+
+    def test_welcome_links_use_current_site_url(self):
+        """Test mail jobs read SITE_URL when they run, not at import"""
+        subscriber = Newsletter.objects.create(email='new@example.com', verification_token='tok')
+        with override_settings(SITE_URL='https://portfolio.example'):
+            tasks.send_newsletter_welcome(subscriber.pk)
+        self.assertIn('https://portfolio.example/newsletter/verify/tok/', mail.outbox[0].body)
+
+    def test_production_requires_site_url(self):
+        """Test the system check rejects a production config without SITE_URL"""
+        with override_settings(DEBUG=False, SITE_URL=''):
+            self.assertEqual([e.id for e in check_site_url(None)], ['core.E001'])
+        with override_settings(DEBUG=False, SITE_URL='https://portfolio.example'):
+            self.assertEqual(check_site_url(None), [])
+
+    def test_project_view_milestone_queued(self):
+        """Test the view that takes a project to 100 views queues the milestone mail"""
+        project = make_project("Popular", views=99)
+        with mock.patch.object(tasks._executor, 'submit') as submit:
+            with self.captureOnCommitCallbacks(execute=True):
+                self.client.get(reverse('project_detail', kwargs={'slug': project.slug}))
+        submit.assert_called_once_with(tasks._run, tasks.send_project_milestone, project.pk, 100)
+
+    def test_project_view_past_missed_milestone_queues_it(self):
+        """Test a milestone skipped over by concurrent views is still queued"""
+        project = make_project("Busy", views=120)
+        with mock.patch.object(tasks._executor, 'submit') as submit:
+            with self.captureOnCommitCallbacks(execute=True):
+                response = self.client.get(project.get_absolute_url())
+        self.assertEqual(response.context['project'].views, 121)
+        submit.assert_called_once_with(tasks._run, tasks.send_project_milestone, project.pk, 100)
+
+    def test_project_milestone_sent_once(self):
+        """Test a milestone is e-mailed once however often it is queued"""
+        project = make_project("Popular", views=100)
+        tasks.send_project_milestone(project.pk, 100)
+        tasks.send_project_milestone(project.pk, 100)
+        self.assertEqual(len(mail.outbox), 1)
+    
+    def test_milestone_backfill_marks_passed_milestones(self):
+        """Test the 0012 backfill records the highest milestone each project passed"""
+        backfill = import_module('core.migrations.0012_backfill_milestone_notified')
+        views = {'Fresh': 99, 'Popular': 100, 'Busy': 720}
+        for title, count in views.items():
+            make_project(title, views=count)
+        backfill.backfill_milestones(apps, None)
+        self.assertEqual(
+            dict(Project.objects.values_list('title', 'milestone_notified')),
+            {'Fresh': 0, 'Popular': 100, 'Busy': 500},
+        )
+    
+    def test_new_post_not_queued_without_subscribers(self):
+        """Test publishing with no verified subscribers queues nothing"""
+        Newsletter.objects.create(email='pending@example.com', is_active=True, is_verified=False)
+        with mock.patch.object(tasks._executor, 'submit') as submit:
+            with self.captureOnCommitCallbacks(execute=True):
+                post = make_post("Quiet", status="draft")
+                post.status = "published"
+                post.save()
+        self.assertNotIn(tasks.send_new_post_notifications, [c.args[1] for c in submit.call_args_list])
+    
+    def test_new_post_fanout_batches_bcc(self):
+        """Test new-post mail goes out in bcc batches of 50"""
+        Newsletter.objects.bulk_create(
+            Newsletter(email=f"reader{n}@example.com", is_active=True, is_verified=True)
+            for n in range(120)
+        )
+        author = User.objects.create_user(username="author")
+        post = make_post("Launch", author=author)
+        tasks.send_new_post_notifications(post.pk)
+        self.assertEqual([len(m.bcc) for m in mail.outbox], [50, 50, 20])
+
+
+class AdminTestCase(FreshCacheMixin, TestCase):
     """Test admin interface"""
     
     def setUp(self):
+        super().setUp()
         self.client = Client()
         self.admin_user = User.objects.create_superuser(
             username='admin',
@@ -196,11 +785,122 @@ class AdminTestCase(TestCase):
         response = self.client.get('/admin/core/project/')
         self.assertEqual(response.status_code, 200)
 
+    def test_admin_blogpost_list_query_count(self):
+        """Test blog post changelist queries don't grow with row count"""
+        def add_post(n):
+            post = make_post(f"Post {n}", author=self.admin_user)
+            BlogComment.objects.create(post=post, name="Reader", email="r@example.com", content="Nice post")
+
+        self.client.login(username='admin', password='admin123')
+        add_post(1)
+        self.client.get('/admin/core/blogpost/')  # warm per-process caches
+        with CaptureQueriesContext(connection) as one_row:
+            self.client.get('/admin/core/blogpost/')
+        add_post(2)
+        add_post(3)
+        with CaptureQueriesContext(connection) as three_rows:
+            response = self.client.get('/admin/core/blogpost/')
+
+        self.assertContains(response, '💬 1')
+        self.assertEqual(len(one_row), len(three_rows))
+
+    def test_admin_search_matches_partial_words_and_emails(self):
+        """Test changelist search finds partial names, whole emails and domains"""
+        jane = ContactMessage.objects.create(
+            name='Jane', email='jane@example.com', subject='Hi', message='Hello there'
+        )
+        bob = ContactMessage.objects.create(
+            name='Bob', email='bob@gmail.com', subject='Quote', message='Need a site'
+        )
+        self.client.login(username='admin', password='admin123')
+
+        def found(term):
+            response = self.client.get('/admin/core/contactmessage/', {'q': term})
+            return [m.pk for m in response.context['cl'].result_list]
+
+        # Take the full-text branch; on SQLite its lookups fall back to ILIKE
+        with mock.patch('core.admin.uses_full_text_search', return_value=True):
+            self.assertEqual(found('Jan'), [jane.pk])
+            self.assertEqual(found('jane@example.com'), [jane.pk])
+            self.assertEqual(found('gmail'), [bob.pk])
+
+    def test_regenerate_thumbnails_keeps_files_when_a_row_fails(self):
+        """Test an unreadable image is skipped and old thumbnails go only after the update"""
+        def png():
+            buf = BytesIO()
+            Image.new('RGB', (40, 30), 'red').save(buf, 'PNG')
+            return SimpleUploadedFile('shot.png', buf.getvalue(), 'image/png')
+
+        self.client.login(username='admin', password='admin123')
+        with tempfile.TemporaryDirectory() as media_root, override_settings(MEDIA_ROOT=media_root):
+            good = make_project('Good', featured_image=png())
+            bad = make_project('Bad', featured_image=png())
+            with open(bad.featured_image.path, 'wb') as fh:
+                fh.write(b'not an image')
+            old_good, old_bad = good.thumbnail.path, bad.thumbnail.path
+
+            self.client.post('/admin/core/project/', {
+                'action': 'regenerate_thumbnails',
+                '_selected_action': [good.pk, bad.pk],
+            })
+
+            good.refresh_from_db()
+            bad.refresh_from_db()
+            self.assertNotEqual(good.thumbnail.path, old_good)
+            self.assertTrue(os.path.exists(good.thumbnail.path))
+            self.assertFalse(os.path.exists(old_good))
+            self.assertEqual(bad.thumbnail.path, old_bad)
+            self.assertTrue(os.path.exists(old_bad))
+
+    def test_bulk_action_drops_derived_caches(self):
+        """Test an update()-based admin action clears the caches a save would"""
+        post = make_post("Draft", author=self.admin_user, status="draft")
+        keys = DERIVED_CACHE_KEYS[BlogPost]
+        cache.set_many(dict.fromkeys(keys, 'stale'))
+        self.client.login(username='admin', password='admin123')
+        self.client.post('/admin/core/blogpost/', {
+            'action': 'publish_posts',
+            '_selected_action': [post.pk],
+        })
+        self.assertEqual(BlogPost.objects.get(pk=post.pk).status, 'published')
+        self.assertEqual(cache.get_many(keys), {})
+
+    def test_comment_changelist_skips_post_bodies(self):
+        """Test the comment changelist joins its posts without their text columns"""
+        post = make_post("Commented", author=self.admin_user)
+        BlogComment.objects.create(post=post, name="Reader", email="r@example.com", content="Nice")
+        self.client.login(username='admin', password='admin123')
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get('/admin/core/blogcomment/')
+        self.assertContains(response, "Commented")
+        joined = [q['sql'] for q in queries if 'JOIN "core_blogpost"' in q['sql']]
+        self.assertTrue(joined)
+        for sql in joined:
+            self.assertNotIn('"core_blogpost"."content"', sql)
+            self.assertNotIn('"core_blogpost"."excerpt"', sql)
+
+    def test_admin_export_as_csv(self):
+        """Test CSV export streams a header plus one row per selection"""
+        self.client.login(username='admin', password='admin123')
+        msg = ContactMessage.objects.create(
+            name='Jane', email='jane@example.com', subject='Hi', message='Hello there'
+        )
+        response = self.client.post('/admin/core/contactmessage/', {
+            'action': 'export_as_csv',
+            '_selected_action': [msg.pk],
+        })
+        self.assertTrue(response.streaming)
+        lines = b''.join(response.streaming_content).decode().splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertTrue(lines[0].startswith('id,'))
+        self.assertIn('jane@example.com', lines[1])
+
 
-class SEOTestCase(TestCase):
+class SEOTestCase(FreshCacheMixin, TestCase):
     """Test SEO features"""
     
     def setUp(self):
+        super().setUp()
         self.client = Client()
     
     def test_sitemap_exists(self):
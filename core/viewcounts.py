@@ -0,0 +1,80 @@
+"""
+Write-behind view counters for Project and BlogPost.
+
+Each detail-page view used to be its own UPDATE on a hot row. Views are
+now tallied per process and written as one UPDATE per model, at most
+once every VIEW_COUNT_FLUSH_SECONDS, by whichever request crosses the
+interval. There is no Redis or scheduler in this deployment, so the
+tally lives in memory: an idle worker holds its counts until its next
+counted view, and writes what is left when it exits (a worker that is
+killed outright still loses them). Set VIEW_COUNT_FLUSH_SECONDS to 0 to
+write every view at once.
+"""
+import atexit
+import logging
+import threading
+import time
+from collections import Counter
+
+from django.conf import settings
+from django.db.models import Case, F, IntegerField, Value, When
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_pending = {}  # model class -> Counter of pk -> views not yet written
+_last_flush = time.monotonic()
+
+
+def record_view(model, pk):
+    """
+    Count one view of model `pk`, writing the tally if it is due.
+
+    Returns this process's views of `pk` that were not in the database
+    before this call, this one included. A caller that loaded the row
+    first can add it to `views` to show a current total.
+    """
+    global _pending, _last_flush
+    interval = getattr(settings, 'VIEW_COUNT_FLUSH_SECONDS', 10)
+    with _lock:
+        counts = _pending.setdefault(model, Counter())
+        counts[pk] += 1
+        unwritten = counts[pk]
+        if time.monotonic() - _last_flush < interval:
+            return unwritten
+        batch, _pending = _pending, {}
+        _last_flush = time.monotonic()
+    _write(batch)
+    return unwritten
+
+
+def pending(model, pk):
+    """This process's views of model `pk` not yet written; counts nothing."""
+    with _lock:
+        return _pending.get(model, {}).get(pk, 0)
+
+
+def flush():
+    """Write every pending count now."""
+    global _pending, _last_flush
+    with _lock:
+        batch, _pending = _pending, {}
+        _last_flush = time.monotonic()
+    _write(batch)
+
+
+def _write(batch):
+    for model, counts in batch.items():
+        try:
+            model.objects.filter(pk__in=counts).update(views=F('views') + Case(
+                *(When(pk=pk, then=Value(n)) for pk, n in counts.items()),
+                default=Value(0),
+                output_field=IntegerField(),
+            ))
+        except Exception:
+            logger.exception("Error writing %s view counts", model.__name__)
+
+
+# Gunicorn stops workers with SIGTERM on deploys, restarts and idle
+# spin-down; the interpreter then runs atexit handlers.
+atexit.register(flush)
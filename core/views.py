@@ -1,25 +1,23 @@
 from django.shortcuts import render, get_object_or_404, redirect
 from django.views.generic import ListView, DetailView, FormView, TemplateView
 from django.contrib import messages
-from django.core.mail import send_mail, EmailMultiAlternatives
-from django.template.loader import render_to_string
 from django.conf import settings
-from django.db.models import Q, F, Count, Avg, Prefetch, Sum
+from django.db.models import Q, F, Case, Count, Avg, IntegerField, Max, Prefetch, Sum, Value, When
 from django.http import JsonResponse, HttpResponse, Http404, FileResponse
-from django.views.decorators.http import require_POST, require_GET
+from django.views.decorators.http import require_POST, require_GET, condition
 from django.views.decorators.csrf import csrf_exempt
 from django.utils import timezone
-from django.utils.html import strip_tags
 from django.core.cache import cache
 from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
 from django.db import transaction
-from django.urls import reverse
 from django.utils.decorators import method_decorator
 from django.views.decorators.cache import cache_page
 from django.views.decorators.clickjacking import xframe_options_deny
 from django.core.signing import Signer, BadSignature
 from django.contrib.sitemaps import Sitemap
 import hashlib
+import random
+import re
 import secrets
 from datetime import timedelta
 import logging
@@ -32,6 +30,12 @@ from .models import (
     AnalyticsSnapshot
 )
 from .forms import ContactForm, NewsletterForm, BlogCommentForm
+from .search import (
+    full_text_search, search_with_tags,
+    PROJECT_SEARCH_FIELDS, BLOGPOST_SEARCH_FIELDS, SERVICE_SEARCH_FIELDS,
+)
+from . import viewcounts
+from .tasks import enqueue, send_newsletter_welcome, send_project_milestone, VIEW_MILESTONES
 
 logger = logging.getLogger(__name__)
 
@@ -55,15 +59,12 @@ def get_referrer(request):
 
 
 def get_site_settings():
-    cache_key = 'site_settings_v2'
-    obj = cache.get(cache_key)
-    if not obj:
-        try:
-            obj = SiteSettings.load()
-            cache.set(cache_key, obj, 3600)
-        except Exception as e:
-            logger.error(f"SiteSettings load error: {e}")
-    return obj
+    # SiteSettings.load() is cached and invalidated on save
+    try:
+        return SiteSettings.load()
+    except Exception as e:
+        logger.error(f"SiteSettings load error: {e}")
+        return None
 
 
 def invalidate_cache(*keys):
@@ -93,19 +94,59 @@ def track_page_view(request, page_type=None):
 def rate_limit_check(request, action, limit=3, window_hours=1):
     ip = get_client_ip(request)
     cache_key = f"rate_{action}_{ip}"
-    count = cache.get(cache_key, 0)
-    if count >= limit:
-        return True
-    cache.set(cache_key, count + 1, window_hours * 3600)
-    return False
+    timeout = window_hours * 3600
+    # add() only starts the window if none is open and incr() doesn't
+    # touch the expiry, so the window is fixed from the first attempt and
+    # concurrent requests can't both read the same count
+    cache.add(cache_key, 0, timeout)
+    try:
+        count = cache.incr(cache_key)
+    except ValueError:
+        # The window expired between add() and incr()
+        cache.set(cache_key, 1, timeout)
+        count = 1
+    return count > limit
+
+
+def list_etag(request, model):
+    """
+    ETag for a public list page of `model`.
+
+    It changes when a row is added, edited or deleted, when views or likes
+    move, and when SiteSettings or the footer's services are saved, so
+    returning visitors get a 304 instead of a re-rendered page. Returns
+    None, which skips the conditional check, for logged-in users (staff
+    see maintenance banners) and when flash messages are waiting.
+    """
+    if request.user.is_authenticated or len(messages.get_messages(request)):
+        return None
+    cache_key = f'list_etag_{model._meta.model_name}'
+    state = cache.get(cache_key)
+    if state is None:
+        state = (
+            model.objects.aggregate(
+                latest=Max('updated_at'), rows=Count('pk'),
+                views=Sum('views'), likes=Sum('likes'),
+            ),
+            Service.objects.aggregate(latest=Max('updated_at'), rows=Count('pk')),
+        )
+        cache.set(cache_key, state, 60)
+    site_settings = get_site_settings()
+    raw = f"{state}|{site_settings.updated_at if site_settings else ''}"
+    return hashlib.blake2b(raw.encode(), digest_size=16).hexdigest()
 
 
 # Profanity / spam filter
 PROFANITY_LIST = ['spam', 'casino', 'crypto', 'nft', 'pills', 'viagra', 'lottery', 'winner']
+PROFANITY_RE = re.compile('|'.join(map(re.escape, PROFANITY_LIST)), re.IGNORECASE)
+
+# Commenters at these domains skip moderation; read once at import
+TRUSTED_EMAIL_DOMAINS = frozenset(
+    domain.lower() for domain in getattr(settings, 'TRUSTED_EMAIL_DOMAINS', ())
+)
 
 def has_profanity(text):
-    lower = text.lower()
-    return any(word in lower for word in PROFANITY_LIST)
+    return PROFANITY_RE.search(text) is not None
 
 
 # ─────────────────────────────────────────────
@@ -124,7 +165,7 @@ def get_tags_for_model(model_class, filter_kwargs=None, limit=20, count_annotati
     Example:
         get_tags_for_model(Project, {'status': 'completed'}, limit=20)
     """
-    from taggit.models import Tag, TaggedItem
+    from taggit.models import Tag
     from django.contrib.contenttypes.models import ContentType
 
     ct = ContentType.objects.get_for_model(model_class)
@@ -132,14 +173,15 @@ def get_tags_for_model(model_class, filter_kwargs=None, limit=20, count_annotati
         model_class.objects.filter(**(filter_kwargs or {}))
         .values_list('id', flat=True)
     )
-    tag_ids = (
-        TaggedItem.objects.filter(content_type=ct, object_id__in=object_ids)
-        .values_list('tag_id', flat=True)
-    )
+    # Filtering the tagged-item join before annotate() makes the Count
+    # cover only the matching instances, not every use of the tag
     return list(
-        Tag.objects.filter(id__in=tag_ids)
+        Tag.objects.filter(
+            taggit_taggeditem_items__content_type=ct,
+            taggit_taggeditem_items__object_id__in=object_ids,
+        )
         .annotate(**{count_annotation: Count('taggit_taggeditem_items')})
-        .order_by(f'-{count_annotation}')[:limit]
+        .order_by(f'-{count_annotation}', 'name')[:limit]
     )
 
 
@@ -161,20 +203,21 @@ class HomeView(TemplateView):
 
         try:
             context['featured_projects'] = (
-                Project.objects.filter(featured=True, status='completed')
-                .select_related().prefetch_related('tags', 'gallery_images')[:6]
+                Project.objects.filter(featured=True, status='completed').cards()
+                .prefetch_related('tags')[:6]
             )
 
             skills_cache_key = 'skills_grouped_v2'
             skills_data = cache.get(skills_cache_key)
             if not skills_data:
-                skills_qs = Skill.objects.filter(is_active=True).order_by('category', '-proficiency')
+                # One query; featured and grouped are split out in Python
+                skills = list(Skill.objects.filter(is_active=True).order_by('category', '-proficiency'))
                 grouped = {}
-                for skill in skills_qs:
+                for skill in skills:
                     grouped.setdefault(skill.category, []).append(skill)
                 skills_data = {
-                    'all': list(skills_qs),
-                    'featured': list(skills_qs.filter(featured=True)[:12]),
+                    'all': skills,
+                    'featured': [skill for skill in skills if skill.featured][:12],
                     'grouped': grouped,
                 }
                 cache.set(skills_cache_key, skills_data, 1800)
@@ -185,19 +228,20 @@ class HomeView(TemplateView):
                 'skills_grouped': skills_data['grouped'],
             })
 
-            context['experiences'] = Experience.objects.select_related().order_by('-is_current', '-start_date')[:4]
+            context['experiences'] = Experience.objects.order_by('-is_current', '-start_date')[:4]
             context['education'] = Education.objects.all().order_by('-is_current', '-start_date')[:3]
             context['certifications'] = Certification.objects.all().order_by('-issue_date')[:6]
             context['testimonials'] = (
-                Testimonial.objects.filter(is_featured=True, is_approved=True)
-                .select_related('project')[:6]
+                Testimonial.objects.filter(is_featured=True, is_approved=True)[:6]
+            )
+            context['featured_services'] = (
+                Service.objects.filter(is_active=True, featured=True)
+                .only('title', 'slug', 'short_description', 'icon', 'starting_price')[:3]
             )
-            context['services'] = Service.objects.filter(is_active=True).order_by('-featured', 'order')
-            context['featured_services'] = Service.objects.filter(is_active=True, featured=True)[:3]
             context['achievements'] = Achievement.objects.all().order_by('-date_achieved')[:6]
             context['recent_posts'] = (
-                BlogPost.objects.filter(status='published')
-                .select_related('author').prefetch_related('tags')
+                BlogPost.objects.filter(status='published').cards()
+                .with_byline().prefetch_related('tags')
                 .order_by('-published_date')[:3]
             )
             context['social_proof'] = SocialProof.objects.filter(is_active=True).order_by('order')
@@ -206,14 +250,24 @@ class HomeView(TemplateView):
             context['newsletter_form'] = NewsletterForm()
             
             # Stats from database - all pulled directly, with zero as base
+            db_stats = cache.get('home_stats')
+            if db_stats is None:
+                project_stats = Project.objects.aggregate(
+                    total_projects=Count('id', filter=Q(status='completed')),
+                    total_views=Sum('views'),
+                )
+                db_stats = {
+                    'total_projects': project_stats['total_projects'],
+                    'total_views': project_stats['total_views'] or 0,
+                    'total_blog_posts': BlogPost.objects.filter(status='published').count(),
+                    'total_technologies': Skill.objects.filter(is_active=True).count(),
+                }
+                cache.set('home_stats', db_stats, 300)
             context['stats'] = {
                 'years_experience': site_settings.years_experience if site_settings else 0,
-                'total_projects': Project.objects.filter(status='completed').count(),
                 'total_clients': site_settings.happy_clients if site_settings else 0,
                 'coffee_consumed': site_settings.coffee_consumed if site_settings else 0,
-                'total_blog_posts': BlogPost.objects.filter(status='published').count(),
-                'total_views': Project.objects.aggregate(total=Sum('views'))['total'] or 0,
-                'total_technologies': Skill.objects.filter(is_active=True).count(),
+                **db_stats,
             }
 
             # JSON-LD structured data
@@ -246,6 +300,11 @@ class HomeView(TemplateView):
 # Projects
 # ─────────────────────────────────────────────
 
+# Orderings accepted from ?sort= on the list pages
+PROJECT_SORTS = frozenset({'-views', '-created_at', 'title', '-title', '-likes', '-featured', '-project_date'})
+BLOGPOST_SORTS = frozenset({'-published_date', '-views', 'title', '-likes', '-reading_time'})
+
+
 class ProjectListView(ListView):
     model = Project
     template_name = 'core/projects.html'
@@ -253,18 +312,21 @@ class ProjectListView(ListView):
     paginate_by = 12
 
     def get(self, request, *args, **kwargs):
+        # Tracked before the ETag check so 304s still count as visits
         track_page_view(request, 'project')
-        return super().get(request, *args, **kwargs)
+        return condition(etag_func=lambda r, *a, **k: list_etag(r, Project))(
+            super().get
+        )(request, *args, **kwargs)
 
     def get_queryset(self):
         try:
             qs = (
-                Project.objects.filter(status='completed')
-                .select_related()
-                .prefetch_related('tags', 'gallery_images')
+                # Cards show the thumbnail only; the gallery is detail-page only
+                Project.objects.filter(status='completed').cards()
+                .prefetch_related('tags')
             )
             category = self.request.GET.get('category', '').strip()
-            if category and category in dict(Project.CATEGORY_CHOICES):
+            if category in Project.CATEGORY_LABELS:
                 qs = qs.filter(category=category)
 
             tag = self.request.GET.get('tag', '').strip()
@@ -273,17 +335,12 @@ class ProjectListView(ListView):
 
             search = self.request.GET.get('search', '').strip()
             if search:
-                qs = qs.filter(
-                    Q(title__icontains=search) |
-                    Q(description__icontains=search) |
-                    Q(technologies__icontains=search) |
-                    Q(tags__name__icontains=search) |
-                    Q(client__icontains=search)
-                ).distinct()
+                qs = search_with_tags(qs, PROJECT_SEARCH_FIELDS, search)
 
             sort_by = self.request.GET.get('sort', '-created_at').strip()
-            valid_sorts = ['-views', '-created_at', 'title', '-title', '-likes', '-featured', '-project_date']
-            qs = qs.order_by(sort_by if sort_by in valid_sorts else '-created_at')
+            # pk breaks ties (equal views/likes) so OFFSET pages never
+            # repeat or skip a project
+            qs = qs.order_by(sort_by if sort_by in PROJECT_SORTS else '-created_at', '-pk')
             return qs
         except Exception as e:
             logger.error(f"ProjectListView queryset error: {e}")
@@ -300,7 +357,7 @@ class ProjectListView(ListView):
             # ─────────────────────────────────────────────────────────────────
             cache_key = 'project_tags_v2'
             tags = cache.get(cache_key)
-            if not tags:
+            if tags is None:
                 tags = get_tags_for_model(
                     Project,
                     filter_kwargs={'status': 'completed'},
@@ -315,13 +372,14 @@ class ProjectListView(ListView):
             context['current_tag'] = self.request.GET.get('tag', '')
             context['current_sort'] = self.request.GET.get('sort', '-created_at')
             context['search_query'] = self.request.GET.get('search', '')
-            context['total_projects'] = Project.objects.filter(status='completed').count()
             category_counts = (
                 Project.objects.filter(status='completed')
                 .values('category')
                 .annotate(count=Count('id'))
             )
             context['category_counts'] = {c['category']: c['count'] for c in category_counts}
+            # Every completed project is in exactly one category group
+            context['total_projects'] = sum(context['category_counts'].values())
         except Exception as e:
             logger.error(f"ProjectListView context error: {e}")
         return context
@@ -333,21 +391,27 @@ class ProjectDetailView(DetailView):
     context_object_name = 'project'
 
     def get_queryset(self):
-        return Project.objects.select_related().prefetch_related(
-            'tags',
-            'gallery_images',
-            Prefetch('testimonials', queryset=Testimonial.objects.filter(is_approved=True))
-        )
+        return Project.objects.prefetch_related('tags', 'gallery_images')
 
     def get_object(self):
         obj = super().get_object()
         ip = get_client_ip(self.request)
         view_key = f"proj_view_{obj.pk}_{ip}"
         if not cache.get(view_key):
-            Project.objects.filter(pk=obj.pk).update(views=F('views') + 1)
+            # Add the unwritten views instead of re-reading the row, which
+            # would also throw away the prefetched relations
+            obj.views += Project.bump_views(obj.pk)
             cache.set(view_key, True, 1800)
             track_page_view(self.request, 'project')
-        obj.refresh_from_db()
+            # bump_views() skips post_save, so milestones are checked here.
+            # Concurrent views can skip past an exact milestone count, so
+            # look for the highest one reached but not yet e-mailed.
+            reached = max((m for m in VIEW_MILESTONES if m <= obj.views), default=0)
+            if reached > obj.milestone_notified:
+                enqueue(send_project_milestone, obj.pk, reached)
+        else:
+            # Repeat visits aren't counted but still show the unwritten views
+            obj.views += viewcounts.pending(Project, obj.pk)
         return obj
 
     def get_context_data(self, **kwargs):
@@ -366,30 +430,32 @@ class ProjectDetailView(DetailView):
                 "creator": {"@type": "Person", "name": "Brian Getenga"}
             })
 
-            related = []
-            if self.object.tags.exists():
-                related = list(
-                    Project.objects.filter(status='completed')
-                    .exclude(id=self.object.id)
-                    .filter(tags__in=self.object.tags.all())
-                    .annotate(same_tags=Count('tags'))
-                    .order_by('-same_tags', '-views')
-                    .distinct()[:3]
-                )
-            if len(related) < 3:
-                existing_ids = [p.id for p in related] + [self.object.id]
-                extra = list(
-                    Project.objects.filter(status='completed', category=self.object.category)
-                    .exclude(id__in=existing_ids)
-                    .order_by('-views')[:3 - len(related)]
+            # Projects sharing tags first (most shared tags, same category
+            # breaking ties, then views), topped up with same-category
+            # projects (same_tags=0), in one query
+            tag_ids = [tag.pk for tag in self.object.tags.all()]
+            match = Q(category=self.object.category)
+            same_tags = Value(0)
+            if tag_ids:
+                match |= Q(tags__in=tag_ids)
+                same_tags = Count('tags', filter=Q(tags__in=tag_ids))
+            context['related_projects'] = list(
+                Project.objects.filter(status='completed').cards()
+                .exclude(id=self.object.id)
+                .filter(match)
+                .annotate(
+                    same_tags=same_tags,
+                    same_category=Case(
+                        When(category=self.object.category, then=Value(1)),
+                        default=Value(0), output_field=IntegerField(),
+                    ),
                 )
-                related += extra
-
-            context['related_projects'] = related[:3]
+                .order_by('-same_tags', '-same_category', '-views')[:3]
+            )
             liked = self.request.session.get('liked_projects', [])
             context['user_has_liked'] = self.object.id in liked
 
-            qs = Project.objects.filter(status='completed').order_by('-featured', 'order', '-created_at')
+            qs = Project.objects.filter(status='completed').cards().order_by('-featured', 'order', '-created_at')
             ids = list(qs.values_list('id', flat=True))
             try:
                 idx = ids.index(self.object.id)
@@ -421,14 +487,17 @@ class BlogListView(ListView):
     paginate_by = 9
 
     def get(self, request, *args, **kwargs):
+        # Tracked before the ETag check so 304s still count as visits
         track_page_view(request, 'blog')
-        return super().get(request, *args, **kwargs)
+        return condition(etag_func=lambda r, *a, **k: list_etag(r, BlogPost))(
+            super().get
+        )(request, *args, **kwargs)
 
     def get_queryset(self):
         try:
             qs = (
-                BlogPost.objects.filter(status='published')
-                .select_related('author')
+                BlogPost.objects.filter(status='published').cards()
+                .with_byline()
                 .prefetch_related('tags')
             )
             tag = self.request.GET.get('tag', '').strip()
@@ -437,16 +506,10 @@ class BlogListView(ListView):
 
             search = self.request.GET.get('search', '').strip()
             if search:
-                qs = qs.filter(
-                    Q(title__icontains=search) |
-                    Q(excerpt__icontains=search) |
-                    Q(content__icontains=search) |
-                    Q(tags__name__icontains=search)
-                ).distinct()
+                qs = search_with_tags(qs, BLOGPOST_SEARCH_FIELDS, search)
 
             sort_by = self.request.GET.get('sort', '-published_date').strip()
-            valid_sorts = ['-published_date', '-views', 'title', '-likes', '-reading_time']
-            qs = qs.order_by(sort_by if sort_by in valid_sorts else '-published_date')
+            qs = qs.order_by(sort_by if sort_by in BLOGPOST_SORTS else '-published_date', '-pk')
             return qs
         except Exception as e:
             logger.error(f"BlogListView queryset error: {e}")
@@ -463,7 +526,7 @@ class BlogListView(ListView):
             # ─────────────────────────────────────────────────────────────────
             cache_key = 'blog_tags_v2'
             tags = cache.get(cache_key)
-            if not tags:
+            if tags is None:
                 tags = get_tags_for_model(
                     BlogPost,
                     filter_kwargs={'status': 'published'},
@@ -473,8 +536,8 @@ class BlogListView(ListView):
                 cache.set(cache_key, tags, 1800)
 
             context['tags'] = tags
-            context['featured_post'] = BlogPost.objects.filter(status='published', featured=True).first()
-            context['popular_posts'] = BlogPost.objects.filter(status='published').order_by('-views')[:5]
+            context['featured_post'] = BlogPost.objects.filter(status='published', featured=True).cards().first()
+            context['popular_posts'] = BlogPost.objects.filter(status='published').cards().order_by('-views')[:5]
             context['current_tag'] = self.request.GET.get('tag', '')
             context['current_sort'] = self.request.GET.get('sort', '-published_date')
             context['search_query'] = self.request.GET.get('search', '')
@@ -492,7 +555,7 @@ class BlogDetailView(DetailView):
     def get_queryset(self):
         return (
             BlogPost.objects.filter(status='published')
-            .select_related('author')
+            .with_byline()
             .prefetch_related('tags')
         )
 
@@ -501,10 +564,11 @@ class BlogDetailView(DetailView):
         ip = get_client_ip(self.request)
         view_key = f"blog_view_{obj.pk}_{ip}"
         if not cache.get(view_key):
-            BlogPost.objects.filter(pk=obj.pk).update(views=F('views') + 1)
+            obj.views += BlogPost.bump_views(obj.pk)
             cache.set(view_key, True, 1800)
             track_page_view(self.request, 'blog')
-        obj.refresh_from_db()
+        else:
+            obj.views += viewcounts.pending(BlogPost, obj.pk)
         return obj
 
     def get_context_data(self, **kwargs):
@@ -524,36 +588,40 @@ class BlogDetailView(DetailView):
                 "timeRequired": f"PT{self.object.reading_time}M"
             })
 
-            if self.object.tags.exists():
-                related = (
-                    BlogPost.objects.filter(status='published')
-                    .exclude(id=self.object.id)
-                    .filter(tags__in=self.object.tags.all())
-                    .annotate(same_tags=Count('tags'))
-                    .order_by('-same_tags', '-published_date')
-                    .distinct()[:3]
-                )
-            else:
-                related = BlogPost.objects.filter(
-                    status='published'
-                ).exclude(id=self.object.id).order_by('-published_date')[:3]
-
-            context['related_posts'] = related
+            # Posts sharing the most tags first, topped up with the latest
+            # posts (same_tags=0), in one query. GROUP BY post folds the
+            # tag join back to one row per post, so no DISTINCT is needed.
+            tag_ids = [tag.pk for tag in self.object.tags.all()]
+            same_tags = Value(0)
+            if tag_ids:
+                same_tags = Count('tags', filter=Q(tags__in=tag_ids))
+            context['related_posts'] = list(
+                BlogPost.objects.filter(status='published').cards()
+                .exclude(id=self.object.id)
+                .annotate(same_tags=same_tags)
+                .order_by('-same_tags', '-published_date')[:3]
+            )
 
             if self.object.allow_comments:
-                context['comments'] = (
+                comments = list(
                     self.object.comments.filter(is_approved=True, parent__isnull=True)
-                    .prefetch_related('replies')
-                    .select_related()
+                    .prefetch_related(Prefetch(
+                        'replies', queryset=BlogComment.objects.filter(is_approved=True),
+                        to_attr='approved_replies'
+                    ))
+                )
+                context['comments'] = comments
+                # Count the thread as rendered rather than with another query
+                context['comment_count'] = len(comments) + sum(
+                    len(comment.approved_replies) for comment in comments
                 )
-                context['comment_count'] = self.object.comments.filter(is_approved=True).count()
                 context['comment_form'] = BlogCommentForm()
 
             liked_posts = self.request.session.get('liked_posts', [])
             context['user_has_liked'] = self.object.id in liked_posts
             context['newsletter_form'] = NewsletterForm()
 
-            qs = BlogPost.objects.filter(status='published').order_by('-published_date')
+            qs = BlogPost.objects.filter(status='published').cards().order_by('-published_date')
             ids = list(qs.values_list('id', flat=True))
             try:
                 idx = ids.index(self.object.id)
@@ -575,7 +643,12 @@ class BlogDetailView(DetailView):
 @require_POST
 def blog_comment_submit(request, slug):
     try:
-        post = get_object_or_404(BlogPost, slug=slug, status='published', allow_comments=True)
+        # Author joined in (with_byline() would defer the e-mail) so the
+        # self-comment check below needs no query
+        post = get_object_or_404(
+            BlogPost.objects.select_related('author'),
+            slug=slug, status='published', allow_comments=True
+        )
 
         if request.POST.get('website_honeypot'):
             return redirect(post.get_absolute_url() + '#comments')
@@ -603,31 +676,15 @@ def blog_comment_submit(request, slug):
                 except BlogComment.DoesNotExist:
                     pass
 
-            trusted_domains = getattr(settings, 'TRUSTED_EMAIL_DOMAINS', [])
-            author_email = post.author.email if post.author else None
-            email_domain = comment.email.split('@')[-1] if '@' in comment.email else ''
-            if comment.email == author_email or email_domain in trusted_domains:
+            email_domain = comment.email.rpartition('@')[2].lower()
+            author_email = post.author.email if post.author_id else None
+            if comment.email == author_email or email_domain in TRUSTED_EMAIL_DOMAINS:
                 comment.is_approved = True
 
+            # Moderation and reply e-mails are queued by the post_save
+            # receivers in signals.py
             comment.save()
 
-            try:
-                site_settings = get_site_settings()
-                html = render_to_string('emails/comment_notification.html', {
-                    'comment': comment, 'post': post, 'site_settings': site_settings,
-                    'post_url': request.build_absolute_uri(post.get_absolute_url()),
-                })
-                msg = EmailMultiAlternatives(
-                    f"💬 New Comment on '{post.title}'",
-                    strip_tags(html),
-                    settings.DEFAULT_FROM_EMAIL,
-                    [getattr(settings, 'ADMIN_EMAIL', settings.DEFAULT_FROM_EMAIL)],
-                )
-                msg.attach_alternative(html, 'text/html')
-                msg.send(fail_silently=True)
-            except Exception as e:
-                logger.warning(f"Comment email error: {e}")
-
             if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
                 status_msg = '✅ Comment posted!' if comment.is_approved else '📝 Comment pending moderation.'
                 return JsonResponse({
@@ -681,6 +738,8 @@ def contact_view(request):
                 contact.ip_address = get_client_ip(request)
                 contact.user_agent = get_user_agent(request)
                 contact.referrer = get_referrer(request)
+                # The admin notification is queued by the post_save receiver
+                # in signals.py and sent off the request thread
                 contact.save()
 
                 try:
@@ -692,35 +751,7 @@ def contact_view(request):
                 except Exception:
                     pass
 
-                try:
-                    admin_html = render_to_string('emails/contact_notification.html', {
-                        'contact': contact, 'site_settings': site_settings,
-                    })
-                    admin_msg = EmailMultiAlternatives(
-                        f"🔔 New Contact: {contact.subject} [{contact.priority.upper()}]",
-                        strip_tags(admin_html),
-                        settings.DEFAULT_FROM_EMAIL,
-                        [getattr(settings, 'ADMIN_EMAIL', settings.DEFAULT_FROM_EMAIL)],
-                    )
-                    admin_msg.attach_alternative(admin_html, 'text/html')
-                    admin_msg.send(fail_silently=False)
-
-                    user_html = render_to_string('emails/contact_confirmation.html', {
-                        'contact': contact, 'site_settings': site_settings,
-                    })
-                    user_msg = EmailMultiAlternatives(
-                        f"Thanks for reaching out, {contact.name.split()[0]}! 👋",
-                        strip_tags(user_html),
-                        settings.DEFAULT_FROM_EMAIL,
-                        [contact.email],
-                    )
-                    user_msg.attach_alternative(user_html, 'text/html')
-                    user_msg.send(fail_silently=True)
-
-                    messages.success(request, f'✅ Message sent! I typically respond within 24 hours, {contact.name.split()[0]}.')
-                except Exception as e:
-                    logger.error(f"Contact email error: {e}")
-                    messages.success(request, "✅ Message received! I'll get back to you shortly.")
+                messages.success(request, "✅ Message received! I'll get back to you shortly.")
 
                 if request.headers.get('X-Requested-With') == 'XMLHttpRequest':
                     return JsonResponse({'success': True, 'message': 'Message sent successfully!'})
@@ -771,20 +802,22 @@ def newsletter_subscribe(request):
             email = form.cleaned_data['email']
             name = form.cleaned_data.get('name', '')
 
-            existing = Newsletter.objects.filter(email=email).first()
-            if existing:
-                if existing.is_active and existing.is_verified:
+            newsletter, created = Newsletter.objects.get_or_create(
+                email=email,
+                defaults={
+                    'name': name,
+                    'ip_address': get_client_ip(request),
+                    'source': request.GET.get('source', 'website'),
+                    'verification_token': Newsletter.new_verification_token(),
+                },
+            )
+            if not created:
+                if newsletter.is_active and newsletter.is_verified:
                     return JsonResponse({'success': False, 'message': '📬 You\'re already on the list!'})
-                newsletter = existing
                 newsletter.is_active = True
                 newsletter.name = name or newsletter.name
-            else:
-                newsletter = form.save(commit=False)
-                newsletter.ip_address = get_client_ip(request)
-                newsletter.source = request.GET.get('source', 'website')
-
-            newsletter.verification_token = secrets.token_urlsafe(32)
-            newsletter.save()
+                newsletter.verification_token = Newsletter.new_verification_token()
+                newsletter.save()
 
             try:
                 today = timezone.now().date()
@@ -795,33 +828,10 @@ def newsletter_subscribe(request):
             except Exception:
                 pass
 
-            try:
-                site_settings = get_site_settings()
-                verification_url = request.build_absolute_uri(
-                    reverse('newsletter_verify', args=[newsletter.verification_token])
-                )
-                # Generate signed unsubscribe token
-                signer = Signer()
-                unsubscribe_token = signer.sign(newsletter.email)
-                unsubscribe_url = request.build_absolute_uri(
-                    reverse('newsletter_unsubscribe', args=[unsubscribe_token])
-                )
-                html = render_to_string('emails/newsletter_welcome.html', {
-                    'newsletter': newsletter,
-                    'site_settings': site_settings,
-                    'verification_url': verification_url,
-                    'unsubscribe_url': unsubscribe_url,
-                })
-                msg = EmailMultiAlternatives(
-                    f"🎉 Welcome to the newsletter{', ' + name.split()[0] if name else ''}!",
-                    strip_tags(html),
-                    settings.DEFAULT_FROM_EMAIL,
-                    [newsletter.email],
-                )
-                msg.attach_alternative(html, 'text/html')
-                msg.send(fail_silently=True)
-            except Exception as e:
-                logger.warning(f"Newsletter email error: {e}")
+            # New rows get their welcome from the post_save receiver in
+            # signals.py; a returning subscriber has a fresh token to verify
+            if not created:
+                enqueue(send_newsletter_welcome, newsletter.pk)
 
             return JsonResponse({
                 'success': True,
@@ -837,15 +847,21 @@ def newsletter_subscribe(request):
 
 @require_GET
 def newsletter_verify(request, token):
+    verified = 0
     try:
-        newsletter = get_object_or_404(Newsletter, verification_token=token)
-        newsletter.is_verified = True
-        newsletter.is_active = True
-        newsletter.verification_token = ''
-        newsletter.save()
-        messages.success(request, '✅ Email verified! Welcome to the newsletter.')
+        # A token of any other length can't match, so it never reaches the
+        # database. A valid token is consumed by the same single UPDATE
+        # that verifies the address.
+        if len(token) == Newsletter.TOKEN_LENGTH:
+            verified = Newsletter.objects.filter(verification_token=token).update(
+                is_verified=True, is_active=True, verification_token='',
+                updated_at=timezone.now(),
+            )
     except Exception as e:
         logger.error(f"newsletter_verify error: {e}")
+    if verified:
+        messages.success(request, '✅ Email verified! Welcome to the newsletter.')
+    else:
         messages.error(request, '❌ This verification link is invalid or has already been used.')
     return redirect('home')
 
@@ -896,6 +912,8 @@ def newsletter_feedback(request):
 def services_view(request):
     try:
         site_settings = get_site_settings()
+        # Left lazy: services.html renders them inside the services_sections
+        # fragment cache, so a warm page runs none of these queries
         services = Service.objects.filter(is_active=True).order_by('-featured', 'order')
         testimonials = Testimonial.objects.filter(is_approved=True, is_featured=True)[:6]
         faqs = FAQ.objects.filter(is_active=True).order_by('order')[:8]
@@ -906,7 +924,6 @@ def services_view(request):
             'testimonials': testimonials,
             'faqs': faqs,
             'skills': skills,
-            'contact_form': ContactForm(),
         })
     except Exception as e:
         logger.error(f"services_view error: {e}", exc_info=True)
@@ -920,11 +937,22 @@ def service_detail(request, slug):
     try:
         service = get_object_or_404(Service, slug=slug, is_active=True)
         site_settings = get_site_settings()
-        related_services = (
+        # Featured services first, in random order within each group, as
+        # order_by('-featured', '?') did, but picked from a cached id list
+        # instead of sorting the table by RANDOM() per request
+        active = cache.get('active_service_ids')
+        if active is None:
+            active = list(Service.objects.filter(is_active=True).values_list('id', 'featured'))
+            cache.set('active_service_ids', active, 3600)
+        candidates = [(not featured, random.random(), pk) for pk, featured in active if pk != service.id]
+        picked = [pk for _, _, pk in sorted(candidates)[:3]]
+        # The id list can outlive a deactivation; don't link to a 404
+        by_id = (
             Service.objects.filter(is_active=True)
-            .exclude(id=service.id)
-            .order_by('-featured', '?')[:3]
+            .only('title', 'slug', 'short_description', 'icon')
+            .in_bulk(picked)
         )
+        related_services = [by_id[pk] for pk in picked if pk in by_id]
         testimonials = Testimonial.objects.filter(is_approved=True, is_featured=True)[:4]
         faqs = FAQ.objects.filter(is_active=True).order_by('order')[:6]
         initial = {
@@ -932,7 +960,10 @@ def service_detail(request, slug):
             'message': f'Hi,\n\nI\'m interested in your {service.title} service.\n\n',
         }
         contact_form = ContactForm(initial=initial)
-        related_projects = Project.objects.filter(status='completed', featured=True).order_by('-views')[:3]
+        related_projects = (
+            Project.objects.filter(status='completed', featured=True).cards()
+            .order_by('-views')[:3]
+        )
         return render(request, 'core/service_detail.html', {
             'service': service,
             'related_services': related_services,
@@ -955,19 +986,18 @@ def service_detail(request, slug):
 def about_view(request):
     try:
         site_settings = get_site_settings()
-        skills_qs = Skill.objects.filter(is_active=True).order_by('category', '-proficiency')
-        grouped_skills = {}
-        for skill in skills_qs:
-            grouped_skills.setdefault(skill.get_category_display(), []).append(skill)
+        # Left lazy: about.html renders them inside the about_sections
+        # fragment cache, so a warm page runs none of these queries
         return render(request, 'core/about.html', {
             'site_settings': site_settings,
-            'skills': skills_qs,
-            'skills_grouped': grouped_skills,
+            'skills': (
+                Skill.objects.filter(is_active=True)
+                .only('name', 'category', 'icon_class', 'icon_image', 'proficiency')
+                .order_by('category', '-proficiency')
+            ),
             'experiences': Experience.objects.all().order_by('-is_current', '-start_date'),
             'education': Education.objects.all().order_by('-is_current', '-start_date'),
-            'certifications': Certification.objects.all().order_by('-issue_date'),
             'achievements': Achievement.objects.all().order_by('-date_achieved'),
-            'social_proof': SocialProof.objects.filter(is_active=True).order_by('order'),
         })
     except Exception as e:
         logger.error(f"about_view error: {e}", exc_info=True)
@@ -984,35 +1014,47 @@ def search_view(request):
 
     if len(query) >= 2:
         try:
-            projects = Project.objects.filter(
-                Q(title__icontains=query) |
-                Q(description__icontains=query) |
-                Q(technologies__icontains=query) |
-                Q(tags__name__icontains=query) |
-                Q(client__icontains=query),
-                status='completed'
-            ).distinct()[:10]
-
-            posts = BlogPost.objects.filter(
-                Q(title__icontains=query) |
-                Q(excerpt__icontains=query) |
-                Q(content__icontains=query) |
-                Q(tags__name__icontains=query),
-                status='published'
-            ).distinct()[:10]
-
-            services = Service.objects.filter(
-                Q(title__icontains=query) |
-                Q(short_description__icontains=query) |
-                Q(description__icontains=query),
-                is_active=True
-            )[:5]
+            # Result cards list their tags; one IN query per section
+            project_qs = Project.objects.filter(status='completed').cards().prefetch_related('tags')
+            post_qs = BlogPost.objects.filter(status='published').cards().prefetch_related('tags')
+            service_qs = (
+                Service.objects.filter(is_active=True)
+                .only('title', 'slug', 'short_description', 'icon')
+            )
+
+            # Repeat searches reuse the matched pks. Saving a project, post
+            # or service drops search_generation, which orphans every key.
+            generation = cache.get_or_set('search_generation', secrets.token_hex(4), None)
+            normalized = ' '.join(query.casefold().split())
+            cache_key = 'search_' + hashlib.blake2b(
+                f'{generation}|{normalized}'.encode(), digest_size=16
+            ).hexdigest()
+            hits = cache.get(cache_key)
+
+            if hits is None:
+                # Materialise the slices once: the template and the total
+                # below both read them, and a sliced count() is another query
+                projects = list(search_with_tags(project_qs, PROJECT_SEARCH_FIELDS, query)[:10])
+                posts = list(search_with_tags(post_qs, BLOGPOST_SEARCH_FIELDS, query)[:10])
+                services = list(full_text_search(
+                    service_qs, SERVICE_SEARCH_FIELDS, query, prefix=True,
+                )[:5])
+                cache.set(cache_key, tuple(
+                    [obj.pk for obj in found] for found in (projects, posts, services)
+                ), 300)
+            else:
+                # Same default ordering as the search, so pk__in keeps it;
+                # empty sections skip their query
+                project_pks, post_pks, service_pks = hits
+                projects = list(project_qs.filter(pk__in=project_pks)) if project_pks else []
+                posts = list(post_qs.filter(pk__in=post_pks)) if post_pks else []
+                services = list(service_qs.filter(pk__in=service_pks)) if service_pks else []
 
             context.update({
                 'projects': projects,
                 'posts': posts,
                 'services': services,
-                'total_results': projects.count() + posts.count() + services.count(),
+                'total_results': len(projects) + len(posts) + len(services),
             })
         except Exception as e:
             logger.error(f"search_view error: {e}")
@@ -1030,12 +1072,13 @@ def search_view(request):
 @require_POST
 def project_like(request, slug):
     try:
-        project = get_object_or_404(Project, slug=slug)
+        # Only the counter is returned; skip the text columns
+        project = get_object_or_404(Project.objects.only('likes'), slug=slug)
         liked = request.session.get('liked_projects', [])
         if project.id in liked:
             return JsonResponse({'success': False, 'message': 'Already liked', 'likes': project.likes, 'action': 'already_liked'})
         Project.objects.filter(pk=project.pk).update(likes=F('likes') + 1)
-        project.refresh_from_db()
+        project.likes += 1
         liked.append(project.id)
         request.session['liked_projects'] = liked
         request.session.modified = True
@@ -1048,12 +1091,12 @@ def project_like(request, slug):
 @require_POST
 def blog_like(request, slug):
     try:
-        post = get_object_or_404(BlogPost, slug=slug, status='published')
+        post = get_object_or_404(BlogPost.objects.only('likes'), slug=slug, status='published')
         liked = request.session.get('liked_posts', [])
         if post.id in liked:
             return JsonResponse({'success': False, 'message': 'Already liked', 'likes': post.likes, 'action': 'already_liked'})
         BlogPost.objects.filter(pk=post.pk).update(likes=F('likes') + 1)
-        post.refresh_from_db()
+        post.likes += 1
         liked.append(post.id)
         request.session['liked_posts'] = liked
         request.session.modified = True
@@ -1066,7 +1109,7 @@ def blog_like(request, slug):
 @require_GET
 def api_projects(request):
     """JSON API endpoint: /api/projects/?category=&page=&search="""
-    qs = Project.objects.filter(status='completed').select_related()
+    qs = Project.objects.filter(status='completed').cards()
     category = request.GET.get('category', '')
     if category:
         qs = qs.filter(category=category)
@@ -1098,13 +1141,22 @@ def download_resume(request):
     try:
         site_settings = get_site_settings()
         if site_settings and site_settings.resume_file:
-            response = FileResponse(
-                site_settings.resume_file.open('rb'),
-                content_type='application/pdf'
-            )
+            resume = site_settings.resume_file
+            try:
+                resume.path
+            except NotImplementedError:
+                # Remote storage (Cloudinary in production): opening it here
+                # would download the whole PDF into the worker first, so let
+                # the CDN serve it
+                return redirect(resume.url)
             name = (site_settings.site_name or 'Resume').replace(' ', '_')
-            response['Content-Disposition'] = f'attachment; filename="{name}_Resume.pdf"'
-            return response
+            # A real file handle lets gunicorn send it with sendfile(2)
+            return FileResponse(
+                resume.open('rb'),
+                as_attachment=True,
+                filename=f'{name}_Resume.pdf',
+                content_type='application/pdf',
+            )
         messages.warning(request, '📄 Resume not available at the moment. Please contact me directly.')
         return redirect('about')
     except Exception as e:
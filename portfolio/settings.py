@@ -205,8 +205,19 @@ DEFAULT_FROM_EMAIL = env('DEFAULT_FROM_EMAIL', default='briangetenga3@gmail.com'
 # Admin email for contact form notifications
 ADMIN_EMAIL = env('ADMIN_EMAIL', default='briangetenga3@gmail.com')
 
-# Site URL for emails and absolute URLs
-SITE_URL = env('SITE_URL', default='http://localhost:9003')
+# Site URL for emails and absolute URLs. Mail jobs run off the request
+# thread (core/tasks.py), so this is their only source for link hosts. On
+# Render it defaults to the service's own hostname; elsewhere production
+# must set it (system check core.E001 fails migrate otherwise).
+if RENDER_EXTERNAL_HOSTNAME:
+    _default_site_url = f'https://{RENDER_EXTERNAL_HOSTNAME}'
+else:
+    _default_site_url = 'http://localhost:9003' if DEBUG else ''
+SITE_URL = env('SITE_URL', default=_default_site_url).rstrip('/')
+
+# Detail-page view counts are written in batches at most this often per
+# worker (core/viewcounts.py); 0 writes each view immediately
+VIEW_COUNT_FLUSH_SECONDS = env.int('VIEW_COUNT_FLUSH_SECONDS', default=10)
 
 # Security Settings (Production)
 if not DEBUG:
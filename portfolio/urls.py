@@ -6,6 +6,7 @@ from django.urls import path, include
 from django.conf import settings
 from django.conf.urls.static import static
 from django.contrib.sitemaps.views import sitemap
+from django.views.decorators.cache import cache_page
 from core.sitemaps import (
     StaticViewSitemap, ProjectSitemap, BlogPostSitemap
 )
@@ -21,7 +22,9 @@ urlpatterns = [
     path('admin/', admin.site.urls),
     path('', include('core.urls')),
     path('ckeditor/', include('ckeditor_uploader.urls')),
-    path('sitemap.xml', sitemap, {'sitemaps': sitemaps}, name='django.contrib.sitemaps.views.sitemap'),
+    # Crawlers poll this often; an hour's staleness is fine for a sitemap
+    path('sitemap.xml', cache_page(60 * 60)(sitemap), {'sitemaps': sitemaps},
+         name='django.contrib.sitemaps.views.sitemap'),
 ]
 
 # Serve media files in development